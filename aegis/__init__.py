@@ -38,30 +38,126 @@ results = analyzer.get_results()
 __version__ = "0.3.0"
 __author__ = "Aegis Football Advisory Group"
 
-from .config import Config
-from .client import SportsmonksClient, StatsBombClient
-from .etl import ETLPipeline, StatsBombETL
-from .analysis import (
-    # New ML-based classes
-    ManagerDNATrainer,
-    SquadFitAnalyzer,
-    PlayerFit,
-    ManagerProfile,
+# Package logger: silent by default (NullHandler, standard library
+# etiquette), opt into output with e.g. AEGIS_LOG_LEVEL=INFO. Submodules
+# should log via logging.getLogger("aegis") rather than print() for
+# diagnostics — Colab's websocket stdout makes chatty prints expensive.
+import logging as _logging
+import os as _os
+
+log = _logging.getLogger("aegis")
+_level = _os.environ.get("AEGIS_LOG_LEVEL")
+if _level is None:
+    log.addHandler(_logging.NullHandler())
+    log.setLevel(_logging.WARNING)
+else:
+    # Setting the env var is the opt-in, so attach a real stderr
+    # handler — a NullHandler would also suppress logging.lastResort
+    # and the knob could never produce output. A typo'd or lowercase
+    # level name must not turn into an import-time ValueError from
+    # setLevel — normalize, validate, fall back to WARNING.
+    log.addHandler(_logging.StreamHandler())
+    _level = _level.upper()
+    if _level not in _logging.getLevelNamesMapping():
+        log.setLevel(_logging.WARNING)
+        log.warning("Unknown AEGIS_LOG_LEVEL=%r, defaulting to WARNING", _level)
+    else:
+        log.setLevel(_level)
+del _level
+
+# Public symbol -> submodule map for the PEP 562 lazy loader below.
+# Importing aegis no longer drags in matplotlib/requests/numpy transitively;
+# each submodule loads on first attribute access (e.g. `aegis.Config`).
+_LAZY_IMPORTS = {
+    # Config & Clients
+    "Config": "config",
+    "SportsmonksClient": "client",
+    "StatsBombClient": "client",
+    # ETL
+    "ETLPipeline": "etl",
+    "StatsBombETL": "etl",
+    # Analysis (New ML-based classes)
+    "ManagerDNATrainer": "analysis",
+    "SquadFitAnalyzer": "analysis",
+    "PlayerFit": "analysis",
+    "ManagerProfile": "analysis",
     # Constants
-    MANAGER_DNA_FEATURES,
-    STATSBOMB_DNA_FEATURES,
-    DNA_PILLARS,
-    PILLAR_PERCENTILE_MAP,
-    PILLAR_PLAYER_DEMANDS,
-    PLAYER_FIT_FEATURES,
-    FIT_THRESHOLDS,
-    DEFAULT_MANAGERS,
-    POSITION_GROUPS,
+    "MANAGER_DNA_FEATURES": "analysis",
+    "STATSBOMB_DNA_FEATURES": "analysis",
+    "DNA_PILLARS": "analysis",
+    "PILLAR_PERCENTILE_MAP": "analysis",
+    "PILLAR_PLAYER_DEMANDS": "analysis",
+    "PLAYER_FIT_FEATURES": "analysis",
+    "FIT_THRESHOLDS": "analysis",
+    "DEFAULT_MANAGERS": "analysis",
+    "POSITION_GROUPS": "analysis",
     # Legacy compatibility
-    AegisAnalyzer,
-)
-from .visualizations import AegisVisualizer
-from .player_dossier import PlayerDossierGenerator, generate_player_dossier
+    "AegisAnalyzer": "analysis",
+    # Visualization
+    "AegisVisualizer": "visualizations",
+    # Player Dossier
+    "PlayerDossierGenerator": "player_dossier",
+    "generate_player_dossier": "player_dossier",
+}
+
+
+def __getattr__(name):
+    """Lazily import public symbols on first access (PEP 562)."""
+    if name in _LAZY_IMPORTS:
+        import importlib
+        module = importlib.import_module(f".{_LAZY_IMPORTS[name]}", __name__)
+        value = getattr(module, name)
+        globals()[name] = value  # cache so subsequent lookups skip this hook
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
+
+from functools import lru_cache
+
+
+@lru_cache(maxsize=32)
+def _scenario_context(coach_name: str, target_club: str, season_id, version: str):
+    """
+    Precompute the per-scenario constants the pipeline derives from its
+    (coach, club, season) arguments: filesystem-safe names, the dashboard
+    filename and the result-cache key.
+
+    Re-running a scenario (the common notebook loop) now specialises these
+    once per distinct argument tuple instead of redoing the string/hash
+    work on every call.
+    """
+    import hashlib
+
+    safe_coach = coach_name.replace(" ", "_").replace(".", "")
+    safe_club = target_club.replace(" ", "_")
+    cache_key = hashlib.blake2b(
+        f"{coach_name}|{target_club}|{season_id}|{version}".encode(),
+        digest_size=16
+    ).hexdigest()
+    return {
+        "safe_coach": safe_coach,
+        "safe_club": safe_club,
+        "dashboard_filename": f"{safe_coach}_{safe_club}.html",
+        "cache_key": cache_key,
+    }
+
+
+@lru_cache(maxsize=4)
+def _client(api_token: str = None):
+    """
+    Cached SportsmonksClient factory keyed on API token.
+
+    Repeated pipeline calls (batch scenarios in a notebook) reuse the same
+    underlying requests.Session, so TCP/TLS handshakes and the connection
+    pool are paid once per token instead of once per call.
+    """
+    from .client import SportsmonksClient
+    return SportsmonksClient(api_token=api_token)
+
 
 __all__ = [
     # Config & Clients
@@ -99,11 +195,115 @@ __all__ = [
     # Convenience functions
     "run_full_analysis",
     "run_full_analysis_statsbomb",
+    "run_many",
     "train_manager_dna",
     "analyse_squad_fit",
+    "precompile",
+    # Stage-at-a-time entry points
+    "fetch",
+    "analyze",
+    "visualize",
 ]
 
 
+def precompile():
+    """
+    Pre-import the numeric stack and warm the analyzer scoring kernel.
+
+    Call this early (e.g. while a notebook cell is still downloading data)
+    so the first SquadFitAnalyzer scoring pass doesn't pay numpy/sklearn
+    import and kernel warm-up latency.
+    """
+    from .analysis import _ensure_compiled
+    _ensure_compiled()
+
+
+def fetch(
+    coach_name: str,
+    target_club: str,
+    api_token: str = None,
+    base_dir: str = "/content/aegis_data",
+    season_id: int = 23614
+) -> dict:
+    """
+    Stage 1 only: fetch scenario data from Sportsmonks.
+
+    Persists the raw JSON under {base_dir}/raw so analyze() and
+    visualize() can run later without touching the network.
+
+    Args:
+        coach_name: Manager name (e.g., "Thomas Frank")
+        target_club: Target club name (e.g., "Tottenham")
+        api_token: Sportsmonks API token (or set SPORTMONKS_API_TOKEN)
+        base_dir: Base directory for data and outputs
+        season_id: Season to fetch
+
+    Returns:
+        Raw scenario data dict
+    """
+    import os
+
+    from .config import Config
+
+    if api_token:
+        os.environ["SPORTMONKS_API_TOKEN"] = api_token
+
+    Config.set_base_dir(base_dir)
+    Config.setup()
+
+    client = _client(os.environ.get("SPORTMONKS_API_TOKEN"))
+    return client.fetch_scenario(coach_name, target_club, season_id=season_id)
+
+
+def analyze(base_dir: str = "/content/aegis_data") -> dict:
+    """
+    Stage 2 only: run ETL + analysis over previously fetched raw data.
+
+    Needs a prior fetch() (or run_full_analysis) for the same base_dir;
+    makes no network calls, so it is safe for offline/CI reruns.
+
+    Returns:
+        Analysis results dict (legacy AegisAnalyzer format)
+    """
+    from .config import Config
+    from .etl import ETLPipeline
+    from .analysis import AegisAnalyzer
+
+    Config.set_base_dir(base_dir)
+    Config.setup()
+
+    # Hand the ETL output to the analyzer in-memory — no intermediate
+    # write/re-parse round-trip (ETL still persists its artifacts unless
+    # Config.PERSIST_INTERMEDIATES is turned off).
+    manager_dna, squad_profiles = ETLPipeline().run()
+    return AegisAnalyzer().run(
+        manager_dna=manager_dna,
+        squad_profiles=squad_profiles
+    )
+
+
+def visualize(base_dir: str = "/content/aegis_data") -> "AegisVisualizer":
+    """
+    Stage 3 only: re-render all charts from persisted analysis outputs.
+
+    Iterate on chart styling in seconds — only matplotlib work runs,
+    nothing is fetched or recomputed.
+
+    Returns:
+        The AegisVisualizer used (handy for further custom plotting)
+    """
+    from .config import Config
+    from .visualizations import AegisVisualizer
+
+    Config.set_base_dir(base_dir)
+    Config.setup()
+
+    viz = AegisVisualizer()
+    viz.load_results()
+    viz.plot_all()
+    return viz
+
+
 def train_manager_dna(
     api_token: str = None,
     base_dir: str = "/content/aegis_data",
@@ -161,15 +361,18 @@ def train_manager_dna(
           - Ensures consistent timeframe for fair comparison
     """
     import os
-    
+
+    from .config import Config
+    from .analysis import ManagerDNATrainer
+
     if api_token:
         os.environ["SPORTMONKS_API_TOKEN"] = api_token
-    
+
     Config.set_base_dir(base_dir)
     Config.setup()
-    
+
     training_dir = Config.PROCESSED_DIR / "training"
-    
+
     trainer = ManagerDNATrainer(
         training_dir=training_dir,
         season_id=season_id
@@ -230,15 +433,18 @@ def analyse_squad_fit(
         )
     """
     import os
-    
+
+    from .config import Config
+    from .analysis import SquadFitAnalyzer
+
     if api_token:
         os.environ["SPORTMONKS_API_TOKEN"] = api_token
-    
+
     Config.set_base_dir(base_dir)
     Config.setup()
-    
+
     training_dir = Config.PROCESSED_DIR / "training"
-    
+
     analyzer = SquadFitAnalyzer(
         training_dir=training_dir,
         output_dir=Config.OUTPUT_DIR,
@@ -264,7 +470,10 @@ def run_full_analysis(
     train_model: bool = True,
     fetch_all_managers: bool = False,
     league_ids = "top5",
-    output_filename: str = None
+    output_filename: str = None,
+    force_refresh: bool = False,
+    visualize_in_background: bool = False,
+    backend: str = "pandas"
 ):
     """
     Run complete Aegis analysis pipeline (ML-based).
@@ -288,7 +497,22 @@ def run_full_analysis(
         output_filename: HTML output filename (default: auto-generated from
                         coach and club names, e.g. "De_Zerbi_Chelsea.html").
                         Can include a path, e.g. "/content/Chelsea_1.html".
-    
+        force_refresh: Ignore any cached results for this scenario and
+                      re-run the full pipeline. Results are cached per
+                      (coach, club, season, package version) under
+                      {base_dir}/cache/ so repeat calls in a notebook
+                      return instantly. Setting the AEGIS_NOCACHE env
+                      var disables the cache entirely.
+        visualize_in_background: Render the dashboard in a worker thread
+                      so results are returned while matplotlib/HTML work
+                      is still in flight. The pending future is exposed
+                      as results[\"_viz_future\"]; call .result() on it
+                      before exiting short-lived scripts.
+        backend: DataFrame library used by the analysis pipeline:
+                      "pandas" (default), "fireducks" or "modin". The
+                      alternatives are pandas-API drop-ins with compiled/
+                      parallel execution — opt in only if installed.
+
     Returns:
         Dictionary with analysis results
     
@@ -330,16 +554,57 @@ def run_full_analysis(
     """
     import os
     import json
+    import pickle
     from collections import defaultdict
-    
+
+    from .config import Config
+    from .analysis import ManagerDNATrainer, SquadFitAnalyzer
+    from .visualizations import AegisVisualizer
+
     if api_token:
         os.environ["SPORTMONKS_API_TOKEN"] = api_token
-    
+
     Config.set_base_dir(base_dir)
+    Config.set_backend(backend)
     Config.setup()
-    
-    training_dir = Config.PROCESSED_DIR / "training"
-    
+    paths = Config.paths()  # frozen snapshot; cheap slot reads below
+
+    # ── Scenario result cache ──
+    # Re-running the same (coach, club, season) pair in a notebook is common;
+    # skip the fetch/train/analyse pipeline entirely when its results are
+    # already on disk. Embedding __version__ in the key invalidates caches
+    # from older package versions automatically.
+    ctx = _scenario_context(coach_name, target_club, season_id, __version__)
+    cache_file = paths.cache_dir / f"scenario_{ctx['cache_key']}.pkl"
+
+    if (cache_file.exists() and not force_refresh
+            and not os.environ.get("AEGIS_NOCACHE")):
+        # A truncated pickle (interrupted write from an older version,
+        # disk hiccup) is a cache miss, not a crash — drop the file and
+        # recompute.
+        try:
+            with open(cache_file, "rb") as f:
+                results = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError) as e:
+            print(f"  ⚠ Discarding unreadable scenario cache: {e}")
+            try:
+                cache_file.unlink()
+            except OSError:
+                pass
+        else:
+            print(f"✓ Loaded cached analysis: {coach_name} → {target_club}")
+            print(f"  (pass force_refresh=True to recompute)")
+            return results
+
+    training_dir = paths.processed_dir / "training"
+
+    # Warm the scoring kernel while the Phase 1/2 network fetches are in
+    # flight instead of paying the numpy start-up cost serially. Joined
+    # before scoring begins; the warm-up itself is idempotent.
+    import threading
+    warm_thread = threading.Thread(target=precompile, daemon=True)
+    warm_thread.start()
+
     # Phase 1: Train Manager DNA model (if needed)
     if train_model:
         print("\n" + "=" * 60)
@@ -370,24 +635,34 @@ def run_full_analysis(
     
     analyzer = SquadFitAnalyzer(
         training_dir=training_dir,
-        output_dir=Config.OUTPUT_DIR,
+        output_dir=paths.output_dir,
         season_id=season_id
     )
     
     analyzer.load_model()
     analyzer.set_target_manager(coach_name)
     analyzer.fetch_squad(target_club)
+    warm_thread.join()
     analyzer.calculate_fit_scores()
     analyzer.save()
     
     results = analyzer.get_results()
     
     # Phase 3: Generate Visualizations
-    if visualize:
+    def _run_visualization():
         print("\n" + "=" * 60)
         print("PHASE 3: GENERATING VISUALIZATIONS")
         print("=" * 60)
-        
+
+        # Probe capability up front rather than paying the matplotlib
+        # import cost only to fail inside the exception handler below.
+        import importlib.util
+        if importlib.util.find_spec("matplotlib") is None:
+            print("  ⚠ matplotlib not installed — skipping visualizations")
+            return
+        # Headless-safe backend: skip GUI backend probing on Colab/CI
+        os.environ.setdefault("MPLBACKEND", "Agg")
+
         try:
             # Create legacy-compatible results format for visualizer
             position_groups = defaultdict(list)
@@ -450,13 +725,13 @@ def run_full_analysis(
             }
             
             # Save for visualizer
-            with open(Config.OUTPUT_DIR / "aegis_analysis.json", "w") as f:
+            with open(paths.output_dir / "aegis_analysis.json", "w") as f:
                 json.dump(legacy_results, f, indent=2)
             
             # Save recruitment priorities as CSV
             import csv
             if recruitment:
-                with open(Config.OUTPUT_DIR / "recruitment_priorities.csv", "w", newline="") as f:
+                with open(paths.output_dir / "recruitment_priorities.csv", "w", newline="") as f:
                     writer = csv.DictWriter(f, fieldnames=["position", "gap", "urgency", "timeline", "cost_low", "cost_high"])
                     writer.writeheader()
                     writer.writerows(recruitment)
@@ -470,20 +745,36 @@ def run_full_analysis(
             if output_filename:
                 dashboard_filename = output_filename
             else:
-                safe_coach = coach_name.replace(" ", "_").replace(".", "")
-                safe_club  = target_club.replace(" ", "_")
-                dashboard_filename = f"{safe_coach}_{safe_club}.html"
+                dashboard_filename = ctx["dashboard_filename"]
 
             viz.generate_dashboard(filename=dashboard_filename)
 
-            print(f"\n  * Interactive dashboard: {Config.OUTPUT_DIR / dashboard_filename}")
+            print(f"\n  * Interactive dashboard: {paths.output_dir / dashboard_filename}")
             print(f"  * All visualizations are embedded in the dashboard")
             
         except Exception as e:
-            print(f"  * Visualization error: {e}")
+            # Broad on purpose: a viz bug (schema drift in the legacy
+            # results build included) must never take down an analysis
+            # that already succeeded. Print as well as log — the logger
+            # is silent unless AEGIS_LOG_LEVEL is set, and a missing
+            # dashboard with no signal is worse than a noisy one.
             import traceback
+            print(f"  ⚠ Visualization error: {e}")
             traceback.print_exc()
-    
+            log.warning("Visualization error: %s", e, exc_info=True)
+
+    if visualize:
+        if visualize_in_background:
+            # Overlap dashboard rendering with the caller's return path —
+            # the multi-second matplotlib/HTML work no longer blocks access
+            # to the results dict.
+            from concurrent.futures import ThreadPoolExecutor
+            _viz_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="aegis-viz")
+            results["_viz_future"] = _viz_pool.submit(_run_visualization)
+            _viz_pool.shutdown(wait=False)
+        else:
+            _run_visualization()
+
     # Print summary
     print("\n" + "=" * 60)
     print("ANALYSIS COMPLETE")
@@ -497,11 +788,118 @@ def run_full_analysis(
     print(f"  Good Fit: {results['classification_counts']['Good Fit']}")
     print(f"  System Dependent: {results['classification_counts']['System Dependent']}")
     print(f"  Potentially Marginalised: {results['classification_counts']['Potentially Marginalised']}")
-    
-    return results
+
+    # Persist for instant reruns of the same scenario (futures don't
+    # pickle). Dump to a sibling temp file and os.replace into place so
+    # an interrupted write (Ctrl-C mid-dump is routine in notebooks)
+    # never leaves a truncated .pkl at the final path.
+    try:
+        tmp_file = cache_file.with_suffix(".pkl.tmp")
+        with open(tmp_file, "wb") as f:
+            pickle.dump({k: v for k, v in results.items() if k != "_viz_future"}, f)
+        os.replace(tmp_file, cache_file)
+    except OSError as e:
+        print(f"  ⚠ Could not write scenario cache: {e}")
+
     return results
 
 
+def run_many(
+    pairs,
+    api_token: str = None,
+    base_dir: str = "/content/aegis_data",
+    season_id: int = None,
+    train_model: bool = True,
+    fetch_all_managers: bool = False,
+    league_ids = "top5",
+    visualize: bool = False,
+    max_workers: int = 4
+):
+    """
+    Analyse several (coach, club) scenarios in one batch.
+
+    Directory setup, kernel warm-up and Manager DNA training run once,
+    then the per-scenario fetch/score work fans out over a thread pool.
+    The dominant cost per scenario is Sportsmonks I/O, so threads give
+    near-linear speedup while sharing one HTTP session via _client().
+
+    Args:
+        pairs: List of (coach_name, target_club) tuples, e.g.
+               [("Thomas Frank", "Tottenham"), ("Thomas Frank", "Arsenal")]
+        api_token: Sportsmonks API token (or set SPORTMONKS_API_TOKEN)
+        base_dir: Base directory for data and outputs
+        season_id: Season to analyse (None = all known seasons)
+        train_model: Train the Manager DNA model once before scoring
+        fetch_all_managers: Passed through to training
+        league_ids: League filter for training (see run_full_analysis)
+        visualize: Render dashboards too. Forces serial execution —
+                   scenarios would otherwise race on shared output files
+                   and matplotlib state.
+        max_workers: Thread pool width for the parallel path
+
+    Returns:
+        Dict mapping (coach_name, target_club) -> results dict
+    """
+    import os
+    from concurrent.futures import ThreadPoolExecutor
+
+    from .config import Config
+    from .analysis import ManagerDNATrainer, SquadFitAnalyzer
+
+    if api_token:
+        os.environ["SPORTMONKS_API_TOKEN"] = api_token
+
+    Config.set_base_dir(base_dir)
+    Config.setup()
+    precompile()
+
+    training_dir = Config.PROCESSED_DIR / "training"
+
+    if train_model:
+        print("\n" + "=" * 60)
+        print("TRAINING MANAGER DNA MODEL (once for all scenarios)")
+        print("=" * 60)
+        trainer = ManagerDNATrainer(training_dir=training_dir, season_id=season_id)
+        trainer.fetch_manager_data(fetch_all=fetch_all_managers, league_ids=league_ids)
+        trainer.extract_features()
+        trainer.fit()
+        trainer.save()
+
+    if visualize:
+        return {
+            (coach_name, target_club): run_full_analysis(
+                coach_name,
+                target_club,
+                base_dir=base_dir,
+                season_id=season_id,
+                train_model=False,
+                visualize=True
+            )
+            for coach_name, target_club in pairs
+        }
+
+    def _analyse_one(pair):
+        coach_name, target_club = pair
+        analyzer = SquadFitAnalyzer(
+            training_dir=training_dir,
+            output_dir=Config.OUTPUT_DIR,
+            season_id=season_id
+        )
+        analyzer.load_model()
+        analyzer.set_target_manager(coach_name)
+        analyzer.fetch_squad(target_club)
+        analyzer.calculate_fit_scores()
+        return analyzer.get_results()
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        scored = list(pool.map(_analyse_one, pairs))
+
+    return {
+        (coach_name, target_club): result
+        for (coach_name, target_club), result in zip(pairs, scored)
+    }
+
+
 def _discover_teams_and_managers(sb_client, competition_ids, season_id):
     """
     Discover all teams and their managers from StatsBomb match data.
@@ -640,7 +1038,12 @@ def run_full_analysis_statsbomb(
         )
     """
     import os
-    
+
+    from .config import Config
+    from .client import StatsBombClient
+    from .etl import StatsBombETL
+    from .analysis import ManagerDNATrainer
+
     if username:
         os.environ["SB_USERNAME"] = username
     if password:
@@ -895,6 +1298,10 @@ def _run_single_statsbomb_analysis(
     import csv as _csv
     from collections import defaultdict as _dd
 
+    from .config import Config
+    from .analysis import SquadFitAnalyzer
+    from .visualizations import AegisVisualizer
+
     analyzer = SquadFitAnalyzer(season_id=season_id)
     analyzer.load_model()
     
@@ -25,7 +25,11 @@ from .config import Config
 # DATA CLASSES
 # =============================================================================
 
-@dataclass
+# slots avoids a per-instance __dict__ (one PlayerFit per player per
+# scenario adds up in batch runs); frozen is safe because instances are
+# never mutated after construction — they are built complete and only
+# read back via asdict()/attribute access.
+@dataclass(slots=True, frozen=True)
 class PlayerFit:
     """Player fit score result."""
     name: str
@@ -434,6 +438,48 @@ def get_player_role(detailed_position: str = "", position: str = "", position_gr
     return {"GK": "GK", "DEF": "CB", "MID": "CM", "ATT": "ST"}.get(position_group, "CM")
 
 
+def _scoring_dtype():
+    """numpy dtype for the fit-score kernel, per Config.PRECISION."""
+    return np.float32 if Config.PRECISION == "fp32" else np.float64
+
+
+def _score_weighted_percentiles(percentiles: np.ndarray, weights: np.ndarray) -> float:
+    """
+    Weighted average of percentile ranks — the fit-score inner kernel.
+
+    Kept as a standalone numpy function (rather than inline dict arithmetic
+    in _calculate_pillar_fit) so _ensure_compiled() can exercise it once
+    ahead of the first real scoring call, keeping first-run latency off the
+    user-visible critical path.
+
+    Inputs are normalised to a contiguous float dtype so every call hits the
+    same fast BLAS dot-product path regardless of what dtype the caller
+    built the arrays with (mixed int/float python lists produce object or
+    int arrays, which fall back to a much slower reduction). The dtype
+    follows Config.PRECISION — see _scoring_dtype().
+    """
+    dtype = _scoring_dtype()
+    percentiles = np.ascontiguousarray(percentiles, dtype=dtype)
+    weights = np.ascontiguousarray(weights, dtype=dtype)
+    total_weight = weights.sum()
+    if total_weight <= 0:
+        return 50.0
+    return float(np.dot(percentiles, weights) / total_weight)
+
+
+def _ensure_compiled():
+    """
+    Warm the scoring kernel so the first scenario doesn't pay its setup cost.
+
+    The kernel is plain numpy (no JIT dependency in this project), so
+    "compilation" here means importing the numeric stack and running the
+    dot product once — numpy lazily initialises BLAS threading state on
+    first use, which is exactly the latency this shifts off the first call.
+    """
+    n = len(PLAYER_FIT_FEATURES)
+    _score_weighted_percentiles(np.ones(n), np.ones(n))
+
+
 _DATA_DRIVEN_DEMANDS_CACHE = None  # None = not yet checked, {} = checked and absent
 
 
@@ -647,11 +693,12 @@ class ManagerDNATrainer:
             max_coaches: Maximum coaches to fetch
             verbose: Print progress
         """
-        from .client import SportsmonksClient
+        import os
         import re
-        
+
         if self.client is None:
-            self.client = SportsmonksClient()
+            from aegis import _client
+            self.client = _client(os.environ.get("SPORTMONKS_API_TOKEN"))
         
         # Handle league_ids
         if league_ids == "top5":
@@ -809,10 +856,11 @@ class ManagerDNATrainer:
         Returns:
             self for chaining
         """
-        from .client import SportsmonksClient
-        
+        import os
+
         if self.client is None:
-            self.client = SportsmonksClient()
+            from aegis import _client
+            self.client = _client(os.environ.get("SPORTMONKS_API_TOKEN"))
         
         # Determine which managers to fetch
         if managers is None and fetch_all:
@@ -1526,7 +1574,7 @@ class ManagerDNATrainer:
             from sklearn.preprocessing import StandardScaler
             from sklearn.decomposition import PCA
             from sklearn.metrics import silhouette_score
-            import pandas as pd
+            pd = Config.dataframe_module()
         except ImportError:
             raise ImportError("scikit-learn and pandas required. Run: pip install scikit-learn pandas")
         
@@ -1620,7 +1668,7 @@ class ManagerDNATrainer:
         
         Supports both Sportsmonks features and StatsBomb 8-pillar features.
         """
-        import pandas as pd
+        pd = Config.dataframe_module()
 
         feature_cols = self.feature_names or MANAGER_DNA_FEATURES
         overall_mean = self.df_managers[feature_cols].mean()
@@ -1752,7 +1800,7 @@ class ManagerDNATrainer:
         
         Stores results as columns ``pillar_pct_{key}`` in self.df_managers.
         """
-        import pandas as pd
+        pd = Config.dataframe_module()
         
         if verbose:
             print("\n  Computing percentile-based pillar scores...")
@@ -1953,11 +2001,11 @@ class SquadFitAnalyzer:
         self.manager_pillar_scores = None  # 8-pillar scores from DNA
         self.league_percentiles = None     # Percentile distributions by position
         self.target_formation = "4-3-3"   # Set by pipeline before _generate_ideal_xi()
-        self.target_formation = "4-3-3"   # Set by pipeline before _generate_ideal_xi()
+        self._weights_cache = {}           # (position_group, role) -> weight vector
     
     def load_model(self, verbose: bool = True) -> "SquadFitAnalyzer":
         """Load trained Manager DNA model."""
-        import pandas as pd
+        pd = Config.dataframe_module()
         
         model_path = self.training_dir / "manager_dna_model.pkl"
         if not model_path.exists():
@@ -2002,6 +2050,7 @@ class SquadFitAnalyzer:
         season on file is used instead — and flagged — rather than
         silently returning an arbitrary row.
         """
+        self._weights_cache = {}  # dynamic weights derive from the manager
         names = self.df_managers["coach_name"].fillna("")
         
         # Strategy 1: full substring match (original logic)
@@ -2083,7 +2132,7 @@ class SquadFitAnalyzer:
         else:
             # Old model without pillar_pct columns — compute on-the-fly
             # by ranking this manager's features against the training population
-            import pandas as pd
+            pd = Config.dataframe_module()
             
             self.manager_pillar_scores = {}
             for pillar_key, cfg in PILLAR_PERCENTILE_MAP.items():
@@ -2152,7 +2201,8 @@ class SquadFitAnalyzer:
         Works with DNA from either ETLPipeline or StatsBombETL.
         """
         import numpy as np
-        
+
+        self._weights_cache = {}  # dynamic weights derive from the manager
         self.target_manager = manager_dna.get("manager", "Unknown")
         self.target_club = manager_dna.get("team", "Unknown")
         
@@ -2259,7 +2309,7 @@ class SquadFitAnalyzer:
         # Compute percentile-based pillar scores by ranking this manager's
         # features against the training population (even though they're not in it)
         if self.manager_pillar_scores is None and self.df_managers is not None:
-            import pandas as pd
+            pd = Config.dataframe_module()
             
             self.manager_pillar_scores = {}
             for pillar_key, cfg in PILLAR_PERCENTILE_MAP.items():
@@ -2735,22 +2785,40 @@ class SquadFitAnalyzer:
         stretching or not stretching changes the cosmetic number shown but not
         which band a player lands in. Removed rather than kept as dead weight.
         """
-        weights = self._compute_dynamic_weights(position_group, role=role)
-        
-        total_weighted_pct = 0
-        total_weight = 0
-        
-        for feature in PLAYER_FIT_FEATURES:
-            value = player_stats.get(feature, 0)
-            weight = weights.get(feature, 0.5)
-            percentile = self._get_percentile(value, position_group, feature)
-            
-            total_weighted_pct += percentile * weight
-            total_weight += weight
-        
-        raw_score = total_weighted_pct / total_weight if total_weight > 0 else 50.0
-        
+        weights = self._weights_vector(position_group, role)
+
+        percentiles = np.array([
+            self._get_percentile(player_stats.get(f, 0), position_group, f)
+            for f in PLAYER_FIT_FEATURES
+        ])
+
+        raw_score = _score_weighted_percentiles(percentiles, weights)
+
         return max(0, min(100, raw_score))
+
+    def _weights_vector(self, position_group: str, role: str = None) -> np.ndarray:
+        """
+        Weight vector over PLAYER_FIT_FEATURES for a (position_group, role)
+        pair, cached on the analyzer.
+
+        The squad loop is data-parallel across players, but every player
+        sharing a role also shares one weight profile — hoisting the
+        dict-to-array conversion out of the per-player path leaves only
+        the percentile lookups and a single dot product per player. The
+        cache is keyed purely on (position_group, role) and cleared when
+        the target manager changes, since the dynamic weights derive from
+        the manager's pillar scores.
+        """
+        key = (position_group, role)
+        weights = self._weights_cache.get(key)
+        if weights is None:
+            weights_map = self._compute_dynamic_weights(position_group, role=role)
+            weights = np.ascontiguousarray(
+                [weights_map.get(f, 0.5) for f in PLAYER_FIT_FEATURES],
+                dtype=_scoring_dtype()
+            )
+            self._weights_cache[key] = weights
+        return weights
     
     def _get_position_group_from_name(self, position: str, detailed_position: str = "") -> str:
         """Map position name string to group (GK/DEF/MID/ATT)."""
@@ -2764,10 +2832,11 @@ class SquadFitAnalyzer:
 
     def fetch_squad(self, club_name: str, verbose: bool = True) -> "SquadFitAnalyzer":
         """Fetch target club's squad."""
-        from .client import SportsmonksClient
-        
+        import os
+
         if self.client is None:
-            self.client = SportsmonksClient()
+            from aegis import _client
+            self.client = _client(os.environ.get("SPORTMONKS_API_TOKEN"))
         
         if verbose:
             print(f"\nFetching squad for: {club_name}")
@@ -3254,6 +3323,20 @@ class SquadFitAnalyzer:
                         "classification": p.classification
                     })
         
+        # Sibling NDJSON in the dashboard's own schema — the visualizer can
+        # embed these rows verbatim (one parse per line, no column renames
+        # or per-field casts on its side).
+        with open(self.output_dir / "squad_fit.jsonl", "w") as f:
+            for p in self.squad_fit:
+                f.write(json.dumps({
+                    "name": p.name,
+                    "position": p.position,
+                    "group": p.position_group,
+                    "fit": p.fit_score,
+                    "classification": p.classification
+                }))
+                f.write("\n")
+
         if self.ideal_xi:
             with open(self.output_dir / "ideal_xi.csv", "w", newline="") as f:
                 writer = csv.DictWriter(f, fieldnames=self.ideal_xi[0].keys())
@@ -3331,13 +3414,27 @@ class AegisAnalyzer:
         self.ideal_xi = []
         self.recruitment = []
     
-    def run(self) -> Dict:
+    def run(self, manager_dna: Optional[Dict] = None,
+            squad_profiles: Optional[list] = None) -> Dict:
+        """
+        Run the legacy analysis pipeline.
+
+        Args:
+            manager_dna: In-memory manager DNA dict (e.g. straight from
+                         ETLPipeline.run()) — skips the disk round-trip
+            squad_profiles: In-memory player profile dicts, same idea
+        """
         print("\n" + "=" * 50)
         print("AEGIS ANALYSIS ENGINE (Legacy Mode)")
         print("=" * 50)
         print("Note: For ML-based analysis, use SquadFitAnalyzer")
-        
-        self.load_data()
+
+        if manager_dna is None or squad_profiles is None:
+            self.load_data()
+        if manager_dna is not None:
+            self.manager_dna = manager_dna
+        if squad_profiles is not None:
+            self.squad_profiles = squad_profiles
         self.calculate_dna_dimensions()
         self.calculate_squad_fit()
         self.generate_ideal_xi()
@@ -3361,8 +3458,24 @@ class AegisAnalyzer:
                 self.manager_dna = json.load(f)
             print(f"      âœ“ Manager: {self.manager_dna.get('manager', 'Unknown')}")
         
+        # Parquet artifact is only authoritative when this run is
+        # configured for it; a leftover snapshot from an earlier parquet
+        # run must not shadow a freshly written CSV. Memory-mapped read
+        # avoids copying the file through Python buffers.
+        squad_parquet = self.processed_dir / "squad_profiles.parquet"
         squad_file = self.processed_dir / "squad_profiles.csv"
-        if squad_file.exists():
+        loaded = False
+        if Config.OUTPUT_FORMAT == "parquet" and squad_parquet.exists():
+            try:
+                import pyarrow.parquet as pq
+                self.squad_profiles = pq.read_table(
+                    squad_parquet, memory_map=True
+                ).to_pylist()
+                print(f"      âœ“ Squad: {len(self.squad_profiles)} players")
+                loaded = True
+            except ImportError:
+                print(f"      âš  pyarrow not installed - reading squad profiles from CSV")
+        if not loaded and squad_file.exists():
             with open(squad_file) as f:
                 reader = csv.DictReader(f)
                 self.squad_profiles = list(reader)
@@ -5,9 +5,27 @@ Central configuration for paths and settings.
 Supports both Sportsmonks and StatsBomb data sources.
 """
 
+from dataclasses import dataclass
 from pathlib import Path
 
 
+@dataclass(frozen=True, slots=True)
+class ConfigPaths:
+    """
+    Immutable snapshot of the directory layout derived from BASE_DIR.
+
+    Hot code paths that read several directories repeatedly can bind one
+    snapshot locally (slot access, no class-dict lookups) instead of
+    re-resolving Config class attributes, and callers holding a snapshot
+    are insulated from later set_base_dir() calls.
+    """
+    base_dir: Path
+    cache_dir: Path
+    data_dir: Path
+    processed_dir: Path
+    output_dir: Path
+
+
 class Config:
     """
     Configuration settings for Aegis.
@@ -27,6 +45,29 @@ class Config:
     # =========================================================================
     BASE_URL = "https://api.sportmonks.com/v3"
     REQUESTS_PER_SECOND = 2.5
+
+    # =========================================================================
+    # DATAFRAME BACKEND
+    # =========================================================================
+    # Which pandas-compatible DataFrame library the analysis pipeline uses.
+    DATAFRAME_BACKEND = "pandas"
+
+    # Tabular output format for ETL artifacts: "csv" (default) or "parquet".
+    # Parquet (zstd via pyarrow) writes far fewer bytes, which matters on
+    # Colab's slow /content mount; requires pyarrow to be installed.
+    OUTPUT_FORMAT = "csv"
+
+    # Numeric precision for the fit-score kernel: "fp64" (default) or
+    # "fp32". fp32 halves memory traffic on large batch runs; scores are
+    # 0-100 weighted percentile averages reported to one decimal, so
+    # single precision loses nothing visible.
+    PRECISION = "fp64"
+
+    # Write ETL intermediates (manager_dna.json, squad_profiles, ...) to
+    # disk. Set False when the ETL output is handed straight to the
+    # analyzer in-process and reruns from disk aren't needed — skips two
+    # full serialise/parse round-trips per run.
+    PERSIST_INTERMEDIATES = True
     
     # =========================================================================
     # STATSBOMB SETTINGS
@@ -174,6 +215,67 @@ class Config:
         cls.PROCESSED_DIR = cls.BASE_DIR / "processed"
         cls.OUTPUT_DIR = cls.BASE_DIR / "outputs"
     
+    _paths = None  # cached ConfigPaths snapshot, invalidated on base dir change
+
+    @classmethod
+    def paths(cls) -> ConfigPaths:
+        """
+        Return a frozen ConfigPaths snapshot of the current layout.
+
+        Recomputed only when BASE_DIR has changed since the last call.
+        """
+        if cls._paths is None or cls._paths.base_dir != cls.BASE_DIR:
+            cls._paths = ConfigPaths(
+                base_dir=cls.BASE_DIR,
+                cache_dir=cls.CACHE_DIR,
+                data_dir=cls.DATA_DIR,
+                processed_dir=cls.PROCESSED_DIR,
+                output_dir=cls.OUTPUT_DIR,
+            )
+        return cls._paths
+
+    @classmethod
+    def set_backend(cls, backend: str):
+        """
+        Select the DataFrame library used by the analysis pipeline.
+
+        Args:
+            backend: "pandas" (default), "fireducks" or "modin". The
+                     alternatives are pandas-API drop-ins with compiled /
+                     parallel execution; install them separately to opt in.
+        """
+        backend = backend.lower()
+        if backend not in ("pandas", "fireducks", "modin"):
+            raise ValueError(
+                f"Unknown DataFrame backend: {backend!r} "
+                "(expected 'pandas', 'fireducks' or 'modin')"
+            )
+        cls.DATAFRAME_BACKEND = backend
+        return cls
+
+    @classmethod
+    def dataframe_module(cls):
+        """
+        Import and return the configured DataFrame module.
+
+        Falls back to pandas with a warning when the selected backend is
+        not installed, so an opt-in toggle can never break a default run.
+        """
+        if cls.DATAFRAME_BACKEND == "fireducks":
+            try:
+                import fireducks.pandas as pd
+                return pd
+            except ImportError:
+                print("⚠ fireducks not installed — falling back to pandas")
+        elif cls.DATAFRAME_BACKEND == "modin":
+            try:
+                import modin.pandas as pd
+                return pd
+            except ImportError:
+                print("⚠ modin not installed — falling back to pandas")
+        import pandas as pd
+        return pd
+
     @classmethod
     def setup(cls):
         """Create all required directories."""
@@ -23,6 +23,45 @@ from datetime import datetime
 from .config import Config
 
 
+def _write_squad_profiles(rows: List[Dict], output_dir: Path) -> str:
+    """
+    Write squad profiles in the configured tabular format.
+
+    With Config.OUTPUT_FORMAT = "parquet", rows are written zstd-compressed
+    via pyarrow — 5-10× fewer bytes than CSV, which dominates ETL time on
+    Colab's slow /content mount. CSV remains the default and the fallback
+    when pyarrow is not installed.
+
+    Args:
+        rows: Player profile dicts (identical keys per row)
+        output_dir: Directory to write into
+
+    Returns:
+        Name of the file written (for progress output)
+    """
+    if Config.OUTPUT_FORMAT == "parquet":
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+            path = output_dir / "squad_profiles.parquet"
+            pq.write_table(
+                pa.Table.from_pylist(rows),
+                path,
+                compression="zstd",
+                compression_level=3
+            )
+            return path.name
+        except ImportError:
+            print("      ⚠ pyarrow not installed — writing CSV instead")
+
+    path = output_dir / "squad_profiles.csv"
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=rows[0].keys())
+        writer.writeheader()
+        writer.writerows(rows)
+    return path.name
+
+
 class ETLPipeline:
     """
     ETL Pipeline for transforming Sportsmonks data.
@@ -82,7 +121,8 @@ class ETLPipeline:
         self.extract_league_context()
         self.extract_manager_dna()
         self.extract_squad_profiles()
-        self.save()
+        if Config.PERSIST_INTERMEDIATES:
+            self.save()
         
         print("\n" + "=" * 50)
         print("âœ“ ETL COMPLETE")
@@ -796,15 +836,10 @@ class ETLPipeline:
                 json.dump(self.league_context, f, indent=2)
             print(f"      âœ“ league_context.json")
         
-        # Save squad profiles as CSV
+        # Save squad profiles (CSV or parquet, per Config.OUTPUT_FORMAT)
         if self.squad_profiles:
-            csv_path = self.output_dir / "squad_profiles.csv"
-            with open(csv_path, "w", newline="") as f:
-                if self.squad_profiles:
-                    writer = csv.DictWriter(f, fieldnames=self.squad_profiles[0].keys())
-                    writer.writeheader()
-                    writer.writerows(self.squad_profiles)
-            print(f"      âœ“ squad_profiles.csv")
+            written = _write_squad_profiles(self.squad_profiles, self.output_dir)
+            print(f"      âœ“ {written}")
         
         print(f"\n      Output directory: {self.output_dir}")
         
@@ -883,7 +918,8 @@ class StatsBombETL:
         self.extract_league_context()
         self.extract_manager_dna()
         self.extract_squad_profiles()
-        self.save()
+        if Config.PERSIST_INTERMEDIATES:
+            self.save()
         
         print("\n" + "=" * 50)
         print("✓ ETL COMPLETE (StatsBomb)")
@@ -1611,13 +1647,8 @@ class StatsBombETL:
             print(f"      ✓ league_context.json")
         
         if self.squad_profiles:
-            csv_path = self.output_dir / "squad_profiles.csv"
-            with open(csv_path, "w", newline="") as f:
-                if self.squad_profiles:
-                    writer = csv.DictWriter(f, fieldnames=self.squad_profiles[0].keys())
-                    writer.writeheader()
-                    writer.writerows(self.squad_profiles)
-            print(f"      ✓ squad_profiles.csv")
+            written = _write_squad_profiles(self.squad_profiles, self.output_dir)
+            print(f"      ✓ {written}")
         
         print(f"\n      Output directory: {self.output_dir}")
         return self
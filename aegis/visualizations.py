@@ -4,14 +4,183 @@ Aegis Visualizations
 Generate charts and dashboards for analysis results.
 """
 
+import io
+import os
+import re
+import sys
 import json
 import csv
+import zlib
+import hashlib
+import base64
+import shutil
+import subprocess
+from collections import Counter
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Optional
 from datetime import datetime
 
 from .config import Config
 
+# orjson's C decoder is 2-3x faster than stdlib json on the nested
+# analysis documents; entirely optional, stdlib json otherwise.
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# numpy backs every chart method; hoisted here so hot render loops skip
+# the repeated in-function import. Optional like orjson — dashboard-only
+# installs without the matplotlib/numpy stack still import cleanly.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def _json_dumps(obj) -> str:
+    """
+    Encode obj as a JSON string for embedding into generated HTML/JS.
+
+    Uses orjson's C encoder when available (roughly 5x stdlib on the big
+    squad/recruitment payloads, one allocation per payload), stdlib json
+    otherwise. Output is plain ASCII-safe JSON, valid as a JS literal.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj).decode()
+    return json.dumps(obj)
+
+
+def _open_csv_sequential(path):
+    """
+    Open a CSV for one forward pass, hinting the kernel where possible.
+
+    POSIX_FADV_SEQUENTIAL widens readahead on the descriptor so
+    cold-cache reads stream ahead of the parser instead of faulting
+    page by page; marginal on squad-sized files, worthwhile for
+    league-wide exports. A no-op where the advice isn't available.
+    Returns a text-mode handle ready for the csv module (newline="").
+    """
+    f = open(path, "rb")
+    if hasattr(os, "posix_fadvise"):
+        try:
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass
+    return io.TextIOWrapper(f, encoding="utf-8", newline="")
+
+
+def _render_template(static_chunks, values) -> str:
+    """
+    Render a pre-split template: interleave its static chunks (compiled
+    once at import, see _LEGACY_DASHBOARD_STATIC) with per-call values
+    through one StringIO buffer.
+
+    The equivalent string.Template skeleton is not an option here: the
+    embedded JavaScript uses template literals (`${p.x}`), whose `$`
+    collides with Template's own placeholder syntax and raises
+    ValueError on substitute(). Pre-split chunks give the same
+    pay-the-parse-once property without escaping the JS.
+
+    Args:
+        static_chunks: len(values)+1 static strings
+        values: Dynamic strings to splice between them
+
+    Returns:
+        The rendered document
+    """
+    buf = io.StringIO()
+    for static, value in zip(static_chunks, values):
+        buf.write(static)
+        buf.write(value)
+    buf.write(static_chunks[-1])
+    return buf.getvalue()
+
+
+# Interned dashboard-schema keys, shared by every squad row dict built
+# below: one string object per key regardless of squad size, and
+# identity-based fast paths on the dict/JSON-encoder key lookups.
+_KEY_NAME = sys.intern("name")
+_KEY_POSITION = sys.intern("position")
+_KEY_GROUP = sys.intern("group")
+_KEY_FIT = sys.intern("fit")
+_KEY_CLASSIFICATION = sys.intern("classification")
+
+_BABEL_CDN_TAG = (
+    '    <script src="https://unpkg.com/@babel/standalone/babel.min.js">'
+    "</script>\n"
+)
+
+
+def _css_slug(s: str) -> str:
+    """Lowercase-and-hyphenate a label for use in a CSS class name."""
+    return re.sub(r"[^a-z0-9]+", "-", s.lower()).strip("-")
+
+
+# Classification / urgency palette for the legacy dashboard, emitted as
+# generated CSS classes (.cls-*, .urgency-*) in its <style> block. Row
+# badges use className instead of per-render inline style objects, so
+# React stops allocating a style literal per row and the browser serves
+# the colour from its style cache.
+_CLASSIFICATION_COLORS = {
+    "Key Enabler": "#22c55e",
+    "Good Fit": "#eab308",
+    "System Dependent": "#f97316",
+    "Potentially Marginalised": "#ef4444",
+}
+_URGENCY_COLORS = {
+    "Critical": "#ef4444",
+    "High": "#f97316",
+    "Medium": "#eab308",
+}
+_DASHBOARD_COLOR_CSS = "".join(
+    [f"        .cls-{_css_slug(k)} {{ background-color: {v}; }}\n"
+     for k, v in _CLASSIFICATION_COLORS.items()]
+    + [f"        .urgency-{_css_slug(k)} {{ background-color: {v}; }}\n"
+       for k, v in _URGENCY_COLORS.items()]
+)
+
+
+@lru_cache(maxsize=4)
+def _compile_jsx(source: str):
+    """
+    Transpile a JSX block to plain JS with esbuild, when it is on PATH.
+
+    With esbuild the components ship as a plain <script> and the Babel
+    CDN tag is dropped — saving the browser a ~2 MB babel-standalone
+    download plus an in-page transpile on every dashboard open. Without
+    esbuild the source is served as text/babel exactly as before.
+
+    Args:
+        source: JSX source (script body, no <script> tag)
+
+    Returns:
+        (script_block, babel_cdn_tag) — the complete <script> element
+        and the CDN tag for the document head ("" when not needed)
+    """
+    esbuild = shutil.which("esbuild")
+    if esbuild:
+        try:
+            proc = subprocess.run(
+                [esbuild, "--loader=jsx"],
+                input=source.encode("utf-8"),
+                capture_output=True,
+                check=True,
+            )
+            compiled = proc.stdout.decode("utf-8")
+            return "<script>\n" + compiled + "    </script>", ""
+        except (OSError, subprocess.CalledProcessError):
+            print("⚠ esbuild failed — falling back to in-browser Babel")
+    return (
+        '<script type="text/babel">\n' + source + "    </script>",
+        _BABEL_CDN_TAG,
+    )
+
+
+# Recruitment urgency ordering for charts; unknown labels sort last.
+_URGENCY_RANK = {"Critical": 0, "High": 1, "Medium": 2}
+
 
 class AegisVisualizer:
     """
@@ -31,6 +200,11 @@ class AegisVisualizer:
         
         # Generate interactive HTML dashboard
         viz.generate_dashboard()
+
+    Constructing the visualizer is cheap: matplotlib is only imported
+    when the first plot_* call touches the plt property, so loading
+    results or generating the HTML dashboard never pays the pyplot
+    import.
     """
     
     # Colours
@@ -42,65 +216,225 @@ class AegisVisualizer:
         "primary": "#3b82f6",           # Blue
         "secondary": "#64748b"          # Slate
     }
-    
-    def __init__(self, output_dir: Optional[Path] = None):
+
+    # (display label, squad_summary key) pairs driving the
+    # classification charts; the label doubles as the COLORS lookup.
+    CLASSIFICATION_KEYS = (
+        ("Key Enabler", "key_enablers"),
+        ("Good Fit", "good_fit"),
+        ("System Dependent", "system_dependent"),
+        ("Potentially Marginalised", "marginalised"),
+    )
+
+    # Fixed attribute layout: skips the per-instance __dict__ and makes
+    # attribute access a little cheaper across the render loop.
+    __slots__ = (
+        "output_dir", "dpi", "_results",
+        "dna", "summary", "ideal_xi", "recruitment",
+        "total_invest_low", "total_invest_high",
+        "_squad_fit_data", "_plt", "_mpatches", "_mpl_checked",
+    )
+
+    def __init__(self, output_dir: Optional[Path] = None, dpi: int = 100):
         """
         Initialize visualizer.
         
         Args:
             output_dir: Directory containing analysis results.
                        Defaults to Config.OUTPUT_DIR
+            dpi: Raster resolution for saved charts. Rasterization cost
+                 scales quadratically with dpi; 100 is plenty on screen,
+                 pass 200 for print-quality exports.
         """
         self.output_dir = Path(output_dir) if output_dir else Config.OUTPUT_DIR
+        self.dpi = dpi
         self.results = None
-        self.squad_fit_data = None
-        
-        # Check for matplotlib
-        try:
-            import matplotlib.pyplot as plt
-            import matplotlib.patches as mpatches
-            self.plt = plt
-            self.mpatches = mpatches
-        except ImportError:
-            print("⚠ matplotlib not installed. Run: pip install matplotlib")
-            self.plt = None
-    
+
+        # Squad-fit CSV is loaded lazily on first .squad_fit_data access —
+        # see the property below. Radar/XI-only callers never read it.
+        self._squad_fit_data = None
+
+        # matplotlib is imported lazily on first .plt access — see the
+        # property below. Dashboard-only callers never pay the import.
+        self._plt = None
+        self._mpatches = None
+        self._mpl_checked = False
+
+    @property
+    def results(self):
+        """Loaded analysis results dict (None before load_results())."""
+        return self._results
+
+    @results.setter
+    def results(self, value):
+        # Bind the subfields every plot_* method reads once, instead of
+        # repeating the same dict lookups in every render call.
+        self._results = value
+        value = value or {}
+        self.dna = value.get("dna_dimensions", {})
+        self.summary = value.get("squad_summary", {})
+        self.ideal_xi = value.get("ideal_xi", [])
+        # Recruitment rows arrive in analysis order with no guaranteed
+        # priority; sort once here so every chart slices the same
+        # urgency-then-gap ranking, and total the investment range while
+        # we hold the list.
+        self.recruitment = sorted(
+            value.get("recruitment", []),
+            key=lambda r: (_URGENCY_RANK.get(r.get("urgency"), 99), -r.get("gap", 0)),
+        )
+        self.total_invest_low = sum(r.get("cost_low", 0) for r in self.recruitment)
+        self.total_invest_high = sum(r.get("cost_high", 0) for r in self.recruitment)
+
+    @property
+    def plt(self):
+        """
+        matplotlib.pyplot, imported on first use (None if unavailable).
+
+        Deferred so constructing a visualizer just to call
+        generate_dashboard() never pays the ~200 ms pyplot import and
+        font-cache work. The headless Agg backend is selected up front
+        when the caller hasn't chosen one, as charts are only saved to
+        files here.
+        """
+        if not self._mpl_checked:
+            self._mpl_checked = True
+            try:
+                os.environ.setdefault("MPLBACKEND", "Agg")
+                import matplotlib.pyplot as plt
+                import matplotlib.patches as mpatches
+                # Constrained layout at draw time replaces the per-figure
+                # tight_layout() + bbox_inches="tight" double layout pass.
+                plt.rcParams["figure.constrained_layout.use"] = True
+                self._plt = plt
+                self._mpatches = mpatches
+            except ImportError:
+                print("⚠ matplotlib not installed. Run: pip install matplotlib")
+        return self._plt
+
+    @property
+    def mpatches(self):
+        """matplotlib.patches, imported together with plt."""
+        if not self._mpl_checked:
+            self.plt  # trigger the lazy import
+        return self._mpatches
+
+    @property
+    def squad_fit_data(self):
+        """
+        Squad-fit CSV rows, loaded on first access (None if absent).
+
+        load_results() no longer reads the CSV eagerly, so callers that
+        only plot the radar or ideal XI skip a stat+open+parse pass.
+        """
+        if self._squad_fit_data is None:
+            self._squad_fit_data = self._load_squad_fit()
+        return self._squad_fit_data
+
     def load_results(self):
         """Load analysis results from JSON."""
         results_file = self.output_dir / "aegis_analysis.json"
         if results_file.exists():
-            with open(results_file) as f:
-                self.results = json.load(f)
+            if orjson is not None:
+                self.results = orjson.loads(results_file.read_bytes())
+            else:
+                with open(results_file) as f:
+                    self.results = json.load(f)
             print(f"✓ Loaded results for: {self.results.get('manager', 'Unknown')}")
         else:
             raise FileNotFoundError(f"Results not found: {results_file}")
-        
-        # Also load squad fit CSV for dashboard
-        squad_file = self.output_dir / "squad_fit_scores.csv"
-        if squad_file.exists():
-            with open(squad_file) as f:
-                reader = csv.DictReader(f)
-                self.squad_fit_data = list(reader)
-        
+
         return self
+
+    def _load_squad_fit(self) -> Optional[List[Dict]]:
+        """
+        Read squad_fit_scores.csv. Prefer pandas' C parser — roughly an
+        order of magnitude faster than csv.DictReader per row — and keep
+        the stdlib reader as the no-pandas fallback.
+        """
+        squad_file = self.output_dir / "squad_fit_scores.csv"
+        if not squad_file.exists():
+            return None
+        try:
+            pd = Config.dataframe_module()
+            return pd.read_csv(squad_file).to_dict(orient="records")
+        except ImportError:
+            with _open_csv_sequential(squad_file) as f:
+                return list(csv.DictReader(f))
     
-    def plot_all(self):
-        """Generate all visualizations."""
+    # Charts rendered by plot_all, each a plot_<name> method below.
+    CHART_NAMES = (
+        "dna_radar",
+        "formation_usage",
+        "squad_fit",
+        "classification_pie",
+        "ideal_xi",
+        "recruitment",
+        "executive_summary",
+    )
+
+    def plot_all(self, parallel: bool = True):
+        """
+        Generate all visualizations.
+
+        The charts share no state after load_results(), so by default
+        each renders in its own worker process (see _render_figure):
+        wall-clock drops from sum-of-charts to roughly max-of-charts,
+        and every worker owns its own pyplot state — the stateful pyplot
+        interface is never driven from two contexts at once. self.results
+        is plain JSON, so it pickles cheaply.
+
+        Each chart keeps its own failure isolation: one bad dataset
+        (e.g. missing recruitment rows) doesn't abort the remaining
+        charts. Pass parallel=False to render sequentially in-process.
+        """
         if not self.plt:
             print("matplotlib required for visualizations")
             return
-        
+
         print("\nGenerating visualizations...")
-        
-        self.plot_dna_radar()
-        self.plot_formation_usage()
-        self.plot_squad_fit()
-        self.plot_classification_pie()
-        self.plot_ideal_xi()
-        self.plot_recruitment()
-        self.plot_executive_summary()
-        
-        print(f"\n✓ All visualizations saved to: {self.output_dir}")
+
+        charts = list(self.CHART_NAMES)
+        failed = 0
+
+        if parallel:
+            try:
+                from concurrent.futures import ProcessPoolExecutor
+
+                with ProcessPoolExecutor(
+                    max_workers=min(len(charts), os.cpu_count() or 1),
+                    initializer=_pool_init,
+                ) as ex:
+                    futures = {
+                        name: ex.submit(
+                            _render_figure, name, self.results, self.output_dir, self.dpi
+                        )
+                        for name in charts
+                    }
+                    for name, future in futures.items():
+                        try:
+                            future.result()
+                        except Exception as e:
+                            failed += 1
+                            print(f"  ⚠ {name} failed: {e}")
+            except OSError as e:
+                # No fork/semaphores (some sandboxes) — render in-process.
+                print(f"  ⚠ Process pool unavailable ({e}) — rendering sequentially")
+                parallel = False
+
+        if not parallel:
+            failed = 0
+            for name in charts:
+                try:
+                    getattr(self, f"plot_{name}")()
+                except Exception as e:
+                    failed += 1
+                    self.plt.close("all")  # don't leak a half-built figure
+                    print(f"  ⚠ {name} failed: {e}")
+
+        if failed:
+            print(f"\n⚠ {len(charts) - failed}/{len(charts)} visualizations saved to: {self.output_dir}")
+        else:
+            print(f"\n✓ All visualizations saved to: {self.output_dir}")
     
     # =========================================================================
     # INTERACTIVE HTML DASHBOARD
@@ -168,7 +502,7 @@ class AegisVisualizer:
             else:
                 print("  ⚠ No manager_profiles rows matched the selected "
                       "season/league — showing unfiltered scatter instead")
-        squad_fit = self._load_csv("squad_fit_scores.csv")
+        squad_fit = self._load_squad_fit_fast()
         ideal_xi = self._load_csv("ideal_xi.csv")
         recruitment = self._load_csv("recruitment_priorities.csv")
         positional_gaps = self._load_csv("positional_gaps.csv")
@@ -205,7 +539,7 @@ class AegisVisualizer:
         # squad_fit_summary.json never contains dna_dimensions — it's written before
         # dna_dimensions is computed in _run_single_statsbomb_analysis.
         if not dna_dimensions and self.results:
-            dna_dimensions = self.results.get("dna_dimensions", {})
+            dna_dimensions = self.dna
         if dna_dimensions:
             print(f"  ✓ Loaded 8-pillar DNA dimensions ({len(dna_dimensions)} pillars)")
         else:
@@ -237,10 +571,10 @@ class AegisVisualizer:
             formation=formation,
         )
         
-        # Save
+        # Save: encode once and write with a single call instead of going
+        # through TextIOWrapper's incremental encoder for a ~150 KB blob.
         output_path = self.output_dir / filename
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(html)
+        output_path.write_bytes(html.encode("utf-8"))
         
         print(f"\n✓ Dashboard saved: {output_path}")
         print("=" * 50)
@@ -260,13 +594,66 @@ class AegisVisualizer:
             print(f"  ⚠ Not found: {filename}")
             return []
         
-        with open(filepath, newline='', encoding='utf-8') as f:
+        with _open_csv_sequential(filepath) as f:
             reader = csv.DictReader(f)
             data = list(reader)
         
         print(f"  ✓ Loaded: {filename} ({len(data)} rows)")
         return data
     
+    def _load_squad_fit_fast(self) -> List[Dict]:
+        """
+        Load squad fit rows, preferring the NDJSON sibling the analyzer
+        writes in dashboard schema (squad_fit.jsonl: one parse per line,
+        keys ready to embed verbatim) over CSV + per-field rename/cast.
+        """
+        jsonl_path = self.output_dir / "squad_fit.jsonl"
+        if jsonl_path.exists():
+            loads = orjson.loads if orjson is not None else json.loads
+            with open(jsonl_path, "rb") as f:
+                rows = [loads(line) for line in f if line.strip()]
+            print(f"  ✓ Loaded: squad_fit.jsonl ({len(rows)} rows)")
+            return rows
+
+        # CSV fallback: csv.reader with column indices cached from the
+        # header. DictReader would allocate a dict per row only for the
+        # dashboard to re-project five fixed columns — unpacking
+        # positionally skips that and emits dashboard-schema rows
+        # directly, so the rebuild pass in the v2 builder is bypassed too.
+        csv_path = self.output_dir / "squad_fit_scores.csv"
+        if not csv_path.exists():
+            print("  ⚠ Not found: squad_fit_scores.csv")
+            return []
+
+        with _open_csv_sequential(csv_path) as f:
+            reader = csv.reader(f)
+            idx = {h: i for i, h in enumerate(next(reader, []))}
+
+            def _col(*names):
+                for n in names:
+                    if n in idx:
+                        return idx[n]
+                return None
+
+            ni = _col("name", "Name")
+            pi = _col("position", "Position")
+            gi = _col("position_group")
+            si = _col("fit_score", "Fit Score")
+            ci = _col("classification", "Classification")
+            rows = [
+                {
+                    _KEY_NAME: row[ni] if ni is not None else "Unknown",
+                    _KEY_POSITION: row[pi] if pi is not None else "Unknown",
+                    _KEY_GROUP: row[gi] if gi is not None else "MID",
+                    _KEY_FIT: round(self._safe_float(row[si]), 1) if si is not None else 0.0,
+                    _KEY_CLASSIFICATION: row[ci] if ci is not None else "Unknown",
+                }
+                for row in reader
+            ]
+
+        print(f"  ✓ Loaded: squad_fit_scores.csv ({len(rows)} rows)")
+        return rows
+
     def _safe_float(self, val, default=0.0):
         """Safely convert to float."""
         try:
@@ -324,21 +711,28 @@ class AegisVisualizer:
             managers_js.append({
                 "name": m.get("coach_name", "Unknown"),
                 "team": m.get("team_name", "Unknown"),
-                "pca1": self._safe_float(m.get("pca_1")),
-                "pca2": self._safe_float(m.get("pca_2")),
+                "pca1": round(self._safe_float(m.get("pca_1")), 2),
+                "pca2": round(self._safe_float(m.get("pca_2")), 2),
                 "cluster": self._safe_int(m.get("cluster"))
             })
         
-        # Process squad fit
-        squad_js = []
-        for p in squad_fit:
-            squad_js.append({
-                "name": p.get("name") or p.get("Name", "Unknown"),
-                "position": p.get("position") or p.get("Position", "Unknown"),
-                "group": p.get("position_group", "MID"),
-                "fit": self._safe_float(p.get("fit_score") or p.get("Fit Score")),
-                "classification": p.get("classification") or p.get("Classification", "Unknown")
-            })
+        # Process squad fit. Rows from squad_fit.jsonl are already in
+        # dashboard schema — embed them verbatim, no rebuild pass.
+        # Scores are rounded to 1 decimal before embedding throughout:
+        # the dashboard renders toFixed(0)/toFixed(1), so full float repr
+        # ("87.34920634920635") is pure payload bloat.
+        if squad_fit and "fit" in squad_fit[0]:
+            squad_js = squad_fit
+        else:
+            squad_js = []
+            for p in squad_fit:
+                squad_js.append({
+                    _KEY_NAME: p.get("name") or p.get("Name", "Unknown"),
+                    _KEY_POSITION: p.get("position") or p.get("Position", "Unknown"),
+                    _KEY_GROUP: p.get("position_group", "MID"),
+                    _KEY_FIT: round(self._safe_float(p.get("fit_score") or p.get("Fit Score")), 1),
+                    _KEY_CLASSIFICATION: p.get("classification") or p.get("Classification", "Unknown")
+                })
         
         # Process ideal XI — use dynamic formation positions from formations.py
         try:
@@ -368,7 +762,7 @@ class AegisVisualizer:
             ideal_js.append({
                 "slot": slot,
                 "name": p.get("name", "Unknown"),
-                "fit": self._safe_float(p.get("fit_score")),
+                "fit": round(self._safe_float(p.get("fit_score")), 1),
                 "x": pos["x"], "y": pos["y"]
             })
         
@@ -378,10 +772,10 @@ class AegisVisualizer:
             for g in positional_gaps:
                 gaps_js.append({
                     "position": g.get("position", "Unknown"),
-                    "avgFit": self._safe_float(g.get("avg_fit") or g.get("avgFit")),
-                    "maxFit": self._safe_float(g.get("max_fit") or g.get("maxFit")),
+                    "avgFit": round(self._safe_float(g.get("avg_fit") or g.get("avgFit")), 1),
+                    "maxFit": round(self._safe_float(g.get("max_fit") or g.get("maxFit")), 1),
                     "count": self._safe_int(g.get("count")),
-                    "gap": self._safe_float(g.get("gap"))
+                    "gap": round(self._safe_float(g.get("gap")), 1)
                 })
         elif squad_js:
             # Generate from squad data
@@ -412,7 +806,7 @@ class AegisVisualizer:
                 "position": r.get("position") or r.get("Position", "Unknown"),
                 "urgency": r.get("urgency") or r.get("Urgency", "Medium"),
                 "timeline": r.get("timeline") or r.get("Timeline", "Summer"),
-                "gap": self._safe_float(r.get("gap") or r.get("Gap")),
+                "gap": round(self._safe_float(r.get("gap") or r.get("Gap")), 1),
                 "costLow": self._safe_int(r.get("cost_low") or r.get("Cost Low")),
                 "costHigh": self._safe_int(r.get("cost_high") or r.get("Cost High"))
             })
@@ -444,15 +838,19 @@ class AegisVisualizer:
                 "Transitions": 50, "Width & Overloads": 50, "Set Pieces": 50,
             }
         
+        dna_dimensions = {
+            k: round(self._safe_float(v), 1) for k, v in dna_dimensions.items()
+        }
+
         # JSON encode
-        manager_json = json.dumps(manager_js)
-        dna_dimensions_json = json.dumps(dna_dimensions)
-        clusters_json = json.dumps(clusters_js)
-        managers_json = json.dumps(managers_js)
-        squad_json = json.dumps(squad_js)
-        ideal_json = json.dumps(ideal_js)
-        gaps_json = json.dumps(gaps_js)
-        recruit_json = json.dumps(recruit_js)
+        manager_json = _json_dumps(manager_js)
+        dna_dimensions_json = _json_dumps(dna_dimensions)
+        clusters_json = _json_dumps(clusters_js)
+        managers_json = _json_dumps(managers_js)
+        squad_json = _json_dumps(squad_js)
+        ideal_json = _json_dumps(ideal_js)
+        gaps_json = _json_dumps(gaps_js)
+        recruit_json = _json_dumps(recruit_js)
         
         # Generate the HTML (inline React dashboard)
         html = self._get_dashboard_v2_template(
@@ -483,498 +881,842 @@ class AegisVisualizer:
         season: str,
         generated_at: str
     ) -> str:
-        """Return the full HTML template for Dashboard v2."""
-        return f'''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>MTFI Dashboard v2</title>
-    <script src="https://cdn.tailwindcss.com"></script>
-    <script src="https://unpkg.com/react@18/umd/react.production.min.js"></script>
-    <script src="https://unpkg.com/react-dom@18/umd/react-dom.production.min.js"></script>
-    <script src="https://unpkg.com/@babel/standalone/babel.min.js"></script>
-    <style>body {{ margin: 0; }} * {{ box-sizing: border-box; }}</style>
-</head>
-<body>
-    <div id="root"></div>
-    <script type="text/babel">
-const {{ useState }} = React;
-
-const MTFIDashboard = () => {{
-  const managerData = {manager_json};
-  const dnaPillars = {dna_dimensions_json};
-  const clusters = {clusters_json};
-  const allManagers = {managers_json};
-  const squadFit = {squad_json};
-  const idealXI = {ideal_json};
-  const positionGaps = {gaps_json};
-  const recruitment = {recruit_json};
-  const season = "{season}";
-
-  const totalPlayers = squadFit.length;
-  const keyEnablers = squadFit.filter(p => p.fit >= 75).length;
-  const goodFit = squadFit.filter(p => p.fit >= 60 && p.fit < 75).length;
-  const systemDependent = squadFit.filter(p => p.fit >= 45 && p.fit < 60).length;
-  const marginalised = squadFit.filter(p => p.fit < 45).length;
-  const avgFit = totalPlayers > 0 ? (squadFit.reduce((a, b) => a + b.fit, 0) / totalPlayers).toFixed(1) : 0;
-  const investmentLow = recruitment.reduce((a, b) => a + (b.costLow || 0), 0);
-  const investmentHigh = recruitment.reduce((a, b) => a + (b.costHigh || 0), 0);
+        """
+        Render the full HTML for Dashboard v2.
 
-  const getFitColor = (score) => {{
-    if (score >= 75) return '#22C55E';
-    if (score >= 60) return '#84CC16';
-    if (score >= 45) return '#EAB308';
-    if (score >= 30) return '#F97316';
-    return '#EF4444';
-  }};
+        Assembled from _DASHBOARD_V2_STATIC, the template pre-split at
+        its ten substitution points (see _render_template). The previous
+        ~20 KB f-string needed every literal brace in the embedded
+        CSS/JSX doubled -- noise that was easy to get wrong and that the
+        parser re-scanned on every call; the static chunks keep single
+        braces and are compiled once at import.
+        """
+        values = (
+            manager_json,
+            dna_dimensions_json,
+            clusters_json,
+            managers_json,
+            squad_json,
+            ideal_json,
+            gaps_json,
+            recruit_json,
+            season,
+            generated_at,
+        )
+        return _render_template(_DASHBOARD_V2_STATIC, values)
+    
+    def _generate_dashboard_html(
+        self,
+        manager: str,
+        primary_formation: str,
+        matches: int,
+        dna_dimensions: Dict,
+        squad_summary: Dict,
+        squad_fit: List,
+        ideal_xi: List,
+        recruitment: List
+    ) -> str:
+        """
+        Generate the HTML content for the dashboard.
 
-  const getClassificationColor = (cls) => ({{
-    'Key Enabler': '#22C55E', 'Good Fit': '#84CC16',
-    'System Dependent': '#EAB308', 'Potentially Marginalised': '#EF4444'
-  }})[cls] || '#64748B';
+        The document is assembled by streaming the pre-split static
+        template chunks (see _LEGACY_DASHBOARD_STATIC below) and the JSON
+        payloads into one StringIO buffer: no giant per-call f-string to
+        parse and copy, and no brace-doubling pass over the embedded
+        JS/CSS.
+        """
+        # Round to display precision before embedding — the dashboard only
+        # ever renders toFixed(0)/toFixed(1).
+        dna_dimensions = {
+            k: round(self._safe_float(v), 1) for k, v in dna_dimensions.items()
+        }
 
-  const KPICard = ({{ title, value, subtitle, color, icon }}) => (
-    <div className="bg-slate-800/60 backdrop-blur border border-slate-700/50 rounded-xl p-4">
-      <div className="flex items-start justify-between">
-        <div>
-          <div className="text-slate-400 text-xs uppercase tracking-wider font-medium">{{title}}</div>
-          <div className={{`text-2xl font-bold mt-1 ${{color || 'text-white'}}`}}>{{value}}</div>
-          {{subtitle && <div className="text-slate-500 text-sm mt-1">{{subtitle}}</div>}}
-        </div>
-        {{icon && <div className="text-2xl opacity-50">{{icon}}</div>}}
-      </div>
-    </div>
-  );
+        # Precompute the sorts and aggregates the React tree used to do
+        # per render: one Python pass instead of repeated browser work.
+        squad_fit_sorted = sorted(
+            squad_fit, key=lambda p: p.get("score", 0), reverse=True
+        )
+        avg_fit = (
+            round(sum(p.get("score", 0) for p in squad_fit) / len(squad_fit), 1)
+            if squad_fit else 0
+        )
+        xi_avg_fit = (
+            round(sum(p.get("fit_score") or 0 for p in ideal_xi) / len(ideal_xi), 1)
+            if ideal_xi else 0
+        )
+        total_invest_low = sum(r.get("cost_low") or 0 for r in recruitment)
+        total_invest_high = sum(r.get("cost_high") or 0 for r in recruitment)
 
-  const ClusterScatter = () => {{
-    if (allManagers.length === 0) return <div className="text-slate-500 text-center py-8">No manager data</div>;
-    const minX = Math.min(...allManagers.map(m => m.pca1)) - 0.5;
-    const maxX = Math.max(...allManagers.map(m => m.pca1)) + 0.5;
-    const minY = Math.min(...allManagers.map(m => m.pca2)) - 0.5;
-    const maxY = Math.max(...allManagers.map(m => m.pca2)) + 0.5;
-    const scaleX = (val) => ((val - minX) / (maxX - minX)) * 100;
-    const scaleY = (val) => 100 - ((val - minY) / (maxY - minY)) * 100;
-    const clusterColors = {{}};
-    clusters.forEach(c => {{ clusterColors[c.id] = c.color; }});
-    return (
-      <div className="flex flex-col h-full">
-        <div className="relative flex-1 bg-slate-900/50 rounded-xl min-h-[220px]">
-          {{allManagers.map((m, i) => (
-            <div key={{i}}
-              className={{`absolute w-3.5 h-3.5 rounded-full transform -translate-x-1/2 -translate-y-1/2 cursor-pointer transition-all hover:scale-150 hover:z-20 ${{m.name === managerData.name ? 'ring-2 ring-white ring-offset-1 ring-offset-slate-900 z-10 w-5 h-5' : ''}}`}}
-              style={{{{ left: `${{2 + scaleX(m.pca1) * 0.96}}%`, top: `${{2 + scaleY(m.pca2) * 0.96}}%`, backgroundColor: clusterColors[m.cluster] || '#64748B' }}}}
-              title={{`${{m.name}} (${{m.team}})`}}>
-              {{m.name === managerData.name && (
-                <div className="absolute -top-5 left-1/2 -translate-x-1/2 text-xs font-bold text-white whitespace-nowrap bg-slate-800/90 px-1.5 py-0.5 rounded">{{managerData.name}}</div>
-              )}}
-            </div>
-          ))}}
-        </div>
-        <div className="flex flex-wrap justify-center gap-x-4 gap-y-1 mt-3 pt-3 border-t border-slate-700/50">
-          {{clusters.map((c) => (
-            <div key={{c.id}} className="flex items-center gap-1.5">
-              <div className="w-2.5 h-2.5 rounded-full flex-shrink-0" style={{{{ backgroundColor: c.color }}}} />
-              <span className="text-slate-400 text-xs">{{c.name}}</span>
-            </div>
-          ))}}
-        </div>
-      </div>
-    );
-  }};
+        classification_counts = Counter(
+            p.get("classification", "Unknown") for p in squad_fit
+        )
+        recruitment_by_window = {"January": [], "Summer": []}
+        for r in recruitment:
+            recruitment_by_window.setdefault(r.get("timeline", "Summer"), []).append(r)
 
-  const FormationPitch = () => (
-    <div className="relative w-full aspect-[3/4] bg-gradient-to-b from-emerald-900/90 to-emerald-800/90 rounded-xl overflow-hidden border border-emerald-700/30">
-      <div className="absolute inset-3 border-2 border-white/20 rounded">
-        <div className="absolute top-1/2 left-0 right-0 h-0.5 bg-white/20" />
-        <div className="absolute top-1/2 left-1/2 -translate-x-1/2 -translate-y-1/2 w-14 h-14 border-2 border-white/20 rounded-full" />
-        <div className="absolute top-0 left-1/2 -translate-x-1/2 w-28 h-10 border-2 border-t-0 border-white/20" />
-        <div className="absolute bottom-0 left-1/2 -translate-x-1/2 w-28 h-10 border-2 border-b-0 border-white/20" />
-      </div>
-      {{idealXI.map((player, i) => (
-        <div key={{i}} className="absolute transform -translate-x-1/2 -translate-y-1/2 text-center group" style={{{{ left: `${{player.x}}%`, top: `${{player.y}}%` }}}}>
-          <div className="w-9 h-9 rounded-full flex items-center justify-center text-white font-bold text-xs border-2 shadow-lg transition-transform group-hover:scale-110"
-            style={{{{ backgroundColor: getFitColor(player.fit), borderColor: 'rgba(255,255,255,0.3)' }}}}>
-            {{Math.round(player.fit)}}
-          </div>
-          <div className="text-white text-xs mt-1 font-medium drop-shadow-lg opacity-90">{{player.name.split(' ').pop()}}</div>
-          <div className="text-white/60 text-xs">{{player.slot}}</div>
-        </div>
-      ))}}
-    </div>
-  );
+        components_script, babel_cdn_tag = _compile_jsx(_LEGACY_DASHBOARD_JSX)
 
-  const PositionFitBars = () => (
-    <div className="space-y-2">
-      {{positionGaps.map((pos, i) => (
-        <div key={{i}} className="flex items-center gap-3">
-          <div className="w-28 text-sm text-slate-300 truncate">{{pos.position}}</div>
-          <div className="flex-1 h-5 bg-slate-700/50 rounded-full overflow-hidden relative">
-            <div className="h-full rounded-full" style={{{{ width: `${{Math.min(pos.avgFit, 100)}}%`, backgroundColor: getFitColor(pos.avgFit) }}}} />
-            {{pos.maxFit > 0 && <div className="absolute top-0 h-full w-0.5 bg-white/60" style={{{{ left: `${{Math.min(pos.maxFit, 100)}}%` }}}} />}}
-            <div className="absolute top-0 h-full w-px bg-white/30 left-3/4" />
-          </div>
-          <div className="w-10 text-right font-mono text-sm text-slate-300">{{pos.avgFit.toFixed(1)}}</div>
-          <div className="w-6 text-center text-slate-500 text-xs">({{pos.count}})</div>
-        </div>
-      ))}}
-    </div>
-  );
+        # The array payloads dominate the document for big squads, and
+        # JSON is very compressible — ship them deflate-compressed +
+        # base64 and let the browser inflate once via the native
+        # DecompressionStream API (see inflatePayload in the template).
+        payload = {
+            "dnaDimensions": dna_dimensions,
+            "squadSummary": squad_summary,
+            "squadFit": squad_fit,
+            "idealXI": ideal_xi,
+            "recruitment": recruitment,
+            "squadFitSorted": squad_fit_sorted,
+            "squadFitTop15": squad_fit_sorted[:15],
+            "recruitmentByWindow": recruitment_by_window,
+        }
+        payload_b64 = base64.b64encode(
+            zlib.compress(_json_dumps(payload).encode("utf-8"), 9)
+        ).decode("ascii")
 
-  const SquadTable = () => (
-    <div className="overflow-auto max-h-80">
-      <table className="w-full text-sm">
-        <thead className="sticky top-0 bg-slate-800">
-          <tr className="text-slate-400 text-xs uppercase tracking-wider">
-            <th className="px-3 py-2 text-left">Player</th>
-            <th className="px-3 py-2 text-left">Position</th>
-            <th className="px-3 py-2 text-center">Fit</th>
-            <th className="px-3 py-2 text-left">Classification</th>
-          </tr>
-        </thead>
-        <tbody>
-          {{[...squadFit].sort((a, b) => b.fit - a.fit).map((player, i) => (
-            <tr key={{i}} className="border-t border-slate-700/30 hover:bg-slate-700/20">
-              <td className="px-3 py-2 font-medium">{{player.name}}</td>
-              <td className="px-3 py-2 text-slate-400">{{player.position}}</td>
-              <td className="px-3 py-2 text-center">
-                <span className="inline-block w-10 py-0.5 rounded text-xs font-bold" style={{{{ backgroundColor: getFitColor(player.fit) + '30', color: getFitColor(player.fit) }}}}>{{player.fit.toFixed(0)}}</span>
-              </td>
-              <td className="px-3 py-2">
-                <span className="text-xs px-2 py-0.5 rounded" style={{{{ backgroundColor: getClassificationColor(player.classification) + '20', color: getClassificationColor(player.classification) }}}}>{{player.classification}}</span>
-              </td>
-            </tr>
-          ))}}
-        </tbody>
-      </table>
-    </div>
-  );
+        values = (
+            manager,
+            babel_cdn_tag,
+            manager,
+            primary_formation,
+            str(matches),
+            _json_dumps(avg_fit),
+            _json_dumps(xi_avg_fit),
+            _json_dumps(total_invest_low),
+            _json_dumps(total_invest_high),
+            _json_dumps(dict(classification_counts)),
+            payload_b64,
+            components_script,
+        )
 
-  const RecruitmentTable = () => (
-    <div>
-      <table className="w-full text-sm">
-        <thead className="bg-slate-700/30">
-          <tr className="text-slate-400 text-xs uppercase tracking-wider">
-            <th className="px-4 py-3 text-left">#</th>
-            <th className="px-4 py-3 text-left">Position</th>
-            <th className="px-4 py-3 text-center">Urgency</th>
-            <th className="px-4 py-3 text-center">Gap</th>
-            <th className="px-4 py-3 text-center">Window</th>
-            <th className="px-4 py-3 text-right">Est. Cost</th>
-          </tr>
-        </thead>
-        <tbody>
-          {{recruitment.map((r, i) => (
-            <tr key={{i}} className="border-t border-slate-700/30 hover:bg-slate-700/20">
-              <td className="px-4 py-3 font-bold text-slate-500">{{r.rank}}</td>
-              <td className="px-4 py-3 font-medium">{{r.position}}</td>
-              <td className="px-4 py-3 text-center">
-                <span className={{`px-2 py-1 rounded text-xs font-medium ${{r.urgency === 'Critical' ? 'bg-red-500/20 text-red-400' : r.urgency === 'High' ? 'bg-orange-500/20 text-orange-400' : 'bg-amber-500/20 text-amber-400'}}`}}>{{r.urgency}}</span>
-              </td>
-              <td className="px-4 py-3 text-center font-mono">{{r.gap.toFixed(1)}}</td>
-              <td className="px-4 py-3 text-center text-slate-400">{{r.timeline}}</td>
-              <td className="px-4 py-3 text-right font-mono">£{{r.costLow}}-{{r.costHigh}}M</td>
-            </tr>
-          ))}}
-        </tbody>
-        {{recruitment.length > 0 && (
-          <tfoot className="bg-slate-700/20 border-t border-slate-600/50">
-            <tr>
-              <td colSpan={{5}} className="px-4 py-3 text-right font-medium text-slate-300">Total Investment</td>
-              <td className="px-4 py-3 text-right font-bold text-lg text-white">£{{investmentLow}}-{{investmentHigh}}M</td>
-            </tr>
-          </tfoot>
-        )}}
-      </table>
-    </div>
-  );
+        return _render_template(_LEGACY_DASHBOARD_STATIC, values)
 
-  const ManagerDNARadar = () => {{
-    const dims = Object.entries(dnaPillars);
-    const n = dims.length;
-    const angleStep = (2 * Math.PI) / n;
-    const centerX = 120, centerY = 120, maxRadius = 90;
-    const points = dims.map(([label, value], i) => {{
-      const angle = i * angleStep - Math.PI / 2;
-      const radius = (Math.min(value, 100) / 100) * maxRadius;
-      return {{ x: centerX + Math.cos(angle) * radius, y: centerY + Math.sin(angle) * radius, label, value }};
-    }});
-    const polygonPoints = points.map(p => `${{p.x}},${{p.y}}`).join(' ');
-    return (
-      <div className="flex flex-col items-center">
-        <svg width="280" height="280" className="overflow-visible">
-          {{[25, 50, 75, 100].map((level) => (<circle key={{level}} cx={{centerX}} cy={{centerY}} r={{(level / 100) * maxRadius}} fill="none" stroke="#334155" strokeWidth="1" opacity="0.5" />))}}
-          {{dims.map((_, i) => {{ const angle = i * angleStep - Math.PI / 2; return (<line key={{i}} x1={{centerX}} y1={{centerY}} x2={{centerX + Math.cos(angle) * maxRadius}} y2={{centerY + Math.sin(angle) * maxRadius}} stroke="#334155" strokeWidth="1" opacity="0.5" />); }})}}
-          <polygon points={{polygonPoints}} fill="#F59E0B" fillOpacity="0.3" stroke="#F59E0B" strokeWidth="2" />
-          {{points.map((p, i) => (<circle key={{i}} cx={{p.x}} cy={{p.y}} r="4" fill="#F59E0B" stroke="#FCD34D" strokeWidth="2" />))}}
-          {{dims.map(([label], i) => {{ const angle = i * angleStep - Math.PI / 2; const labelRadius = maxRadius + 22; const x = centerX + Math.cos(angle) * labelRadius; const y = centerY + Math.sin(angle) * labelRadius; return (<text key={{i}} x={{x}} y={{y}} textAnchor="middle" dominantBaseline="middle" className="fill-slate-400" style={{{{fontSize: '9px'}}}}>{{label}}</text>); }})}}
-          {{points.map((p, i) => (<text key={{'v'+i}} x={{p.x}} y={{p.y - 10}} textAnchor="middle" className="fill-amber-300" style={{{{fontSize: '10px', fontWeight: 'bold'}}}}>{{Math.round(p.value)}}</text>))}}
-        </svg>
-        <div className="mt-4 px-4 py-2 rounded-full bg-amber-500/20 border border-amber-500/50">
-          <span className="text-amber-400 font-semibold">Cluster: {{managerData.clusterName}}</span>
-        </div>
-      </div>
-    );
-  }};
+    # =========================================================================
+    # DNA RADAR
+    # =========================================================================
+    
+    # Radar angle vectors keyed by axis count — the geometry depends only
+    # on len(labels), so batch runs over a candidate pool reuse it.
+    _angle_cache = {}
 
-  return (
-    <div className="min-h-screen bg-gradient-to-br from-slate-950 via-slate-900 to-slate-950 text-white">
-      <div className="border-b border-slate-800 bg-slate-900/50 backdrop-blur sticky top-0 z-30">
-        <div className="max-w-7xl mx-auto px-6 py-4">
-          <div className="flex items-center justify-between">
-            <div className="flex items-center gap-4">
-              <div className="w-10 h-10 rounded-xl bg-gradient-to-br from-amber-500 to-orange-600 flex items-center justify-center font-black text-lg">A</div>
-              <div>
-                <h1 className="text-xl font-bold tracking-tight">Manager Tactical Fit Intelligence</h1>
-                <p className="text-slate-400 text-sm">Aegis Football Advisory Group</p>
-              </div>
-            </div>
-            <div className="text-right">
-              <div className="text-lg font-semibold">{{managerData.name}} → {{managerData.team}}</div>
-              <div className="text-slate-400 text-sm">{{season}} Season Analysis</div>
-            </div>
-          </div>
-        </div>
-      </div>
+    def plot_dna_radar(self):
+        """Generate Manager DNA radar chart."""
+        dimensions = self.dna
+        labels = list(dimensions.keys())
+        values = np.fromiter(dimensions.values(), dtype=float, count=len(labels))
 
-      <div className="max-w-7xl mx-auto px-6 py-6">
-        <div className="grid grid-cols-2 md:grid-cols-6 gap-4 mb-6">
-          <KPICard title="Squad Avg Fit" value={{`${{avgFit}}%`}} subtitle={{`${{totalPlayers}} players`}} icon="📊" />
-          <KPICard title="Key Enablers" value={{keyEnablers}} subtitle="≥75" color="text-emerald-400" icon="🟢" />
-          <KPICard title="Good Fit" value={{goodFit}} subtitle="60-74" color="text-lime-400" icon="🟡" />
-          <KPICard title="System Dependent" value={{systemDependent}} subtitle="45-59" color="text-amber-400" icon="🟠" />
-          <KPICard title="Marginalised" value={{marginalised}} subtitle="<45" color="text-red-400" icon="🔴" />
-          <KPICard title="Investment Req." value={{`£${{investmentLow}}-${{investmentHigh}}M`}} subtitle={{`${{recruitment.length}} priorities`}} icon="💰" />
-        </div>
+        # Complete the loop
+        values = np.concatenate([values, values[:1]])
+        n = len(labels)
+        if n not in self._angle_cache:
+            a = np.linspace(0, 2 * np.pi, n, endpoint=False)
+            self._angle_cache[n] = (a, np.concatenate([a, a[:1]]))
+        angles_open, angles = self._angle_cache[n]
 
-        <div className="grid grid-cols-1 lg:grid-cols-3 gap-6 mb-6">
-          <div className="bg-slate-800/40 backdrop-blur border border-slate-700/50 rounded-2xl p-5">
-            <h2 className="text-lg font-semibold mb-2 flex items-center gap-2"><span className="w-2 h-2 rounded-full bg-amber-500"></span>Manager DNA</h2>
-            <div className="text-center mb-2">
-              <div className="text-xl font-bold">{{managerData.name}}</div>
-              <div className="text-slate-400 text-sm">{{managerData.team}}</div>
-            </div>
-            <ManagerDNARadar />
-            <div className="grid grid-cols-2 gap-2 mt-4 text-sm">
-              <div className="bg-slate-700/30 rounded-lg p-2 text-center">
-                <div className="text-slate-400 text-xs">Goals/Game</div>
-                <div className="font-bold text-lg">{{managerData.goalsScored?.toFixed(2) || 'N/A'}}</div>
-              </div>
-              <div className="bg-slate-700/30 rounded-lg p-2 text-center">
-                <div className="text-slate-400 text-xs">Conceded/Game</div>
-                <div className="font-bold text-lg">{{managerData.goalsConceded?.toFixed(2) || 'N/A'}}</div>
-              </div>
-            </div>
-          </div>
+        fig, ax = self.plt.subplots(figsize=(10, 10), subplot_kw=dict(polar=True))
+        
+        # Plot
+        ax.fill(angles, values, color=self.COLORS["primary"], alpha=0.25)
+        ax.plot(angles, values, color=self.COLORS["primary"], linewidth=2)
+        ax.scatter(angles_open, values[:-1], color=self.COLORS["primary"], s=80, zorder=5)
 
-          <div className="bg-slate-800/40 backdrop-blur border border-slate-700/50 rounded-2xl p-5 flex flex-col">
-            <h2 className="text-lg font-semibold mb-4 flex items-center gap-2"><span className="w-2 h-2 rounded-full bg-violet-500"></span>Manager Clustering (PCA)</h2>
-            <ClusterScatter />
-            <div className="mt-3 text-sm">
-              <span className="text-amber-400 font-semibold">{{managerData.name}}</span>
-              <span className="text-slate-400"> clusters with </span>
-              <span className="text-white font-semibold">{{managerData.clusterName}}</span>
-              <span className="text-slate-400"> managers</span>
-            </div>
-          </div>
+        # Labels
+        ax.set_xticks(angles_open)
+        ax.set_xticklabels(labels, size=11)
+        ax.set_ylim(0, 100)
+        
+        # Title
+        manager = self.results.get("manager", "Unknown")
+        ax.set_title(f"Manager DNA: {manager}", size=16, fontweight="bold", pad=20)
+        
+        self.plt.savefig(self.output_dir / "01_manager_dna_radar.png", dpi=self.dpi)
+        self.plt.close()
+        print("  ✓ 01_manager_dna_radar.png")
+    
+    # =========================================================================
+    # FORMATION USAGE
+    # =========================================================================
+    
+    def plot_formation_usage(self, formation_data: dict = None):
+        """Generate formation usage bar chart.
+        
+        Args:
+            formation_data: Dict from compute_formation_tendency() with 'raw_counts' key.
+                            If None, falls back to illustrative placeholder data.
+        """
+        fig, ax = self.plt.subplots(figsize=(10, 6))
+        
+        if formation_data and formation_data.get("raw_counts"):
+            from .formations import normalize_formation
+            raw = formation_data["raw_counts"]
+            top = sorted(raw.items(), key=lambda x: x[1], reverse=True)[:5]
+            total = sum(v for _, v in top)
+            formations = [normalize_formation(k) for k, _ in top]
+            usage = [round(v / max(total, 1) * 100, 1) for _, v in top]
+        else:
+            # Illustrative placeholder — replaced once formation_data flows through
+            formations = ["4-3-3", "3-5-2", "4-2-3-1", "3-4-3", "5-3-2"]
+            usage = [39.5, 26.3, 17.1, 10.5, 6.6]
+        
+        bars = ax.barh(formations, usage, color=self.COLORS["primary"])
+        
+        # Add percentage labels
+        for bar, pct in zip(bars, usage):
+            ax.text(bar.get_width() + 1, bar.get_y() + bar.get_height()/2,
+                   f"{pct}%", va="center", fontweight="bold")
+        
+        ax.set_xlabel("Usage %")
+        ax.set_title("Formation Usage", fontweight="bold", size=14)
+        ax.set_xlim(0, 50)
+        
+        self.plt.savefig(self.output_dir / "02_formation_usage.png", dpi=self.dpi)
+        self.plt.close()
+        print("  ✓ 02_formation_usage.png")
+    
+    # =========================================================================
+    # SQUAD FIT
+    # =========================================================================
+    
+    def plot_squad_fit(self):
+        """Generate squad fit score distribution."""
+        # Load squad fit CSV. Parse and sort at C level with pandas —
+        # per-row float() plus a Python-level sort otherwise; the
+        # DictReader fallback only runs when pandas is unavailable.
+        squad_file = self.output_dir / "squad_fit_scores.csv"
+        if not squad_file.exists():
+            print("  ⚠ No squad fit data")
+            return
 
-          <div className="bg-slate-800/40 backdrop-blur border border-slate-700/50 rounded-2xl p-5">
-            <h2 className="text-lg font-semibold mb-4 flex items-center gap-2"><span className="w-2 h-2 rounded-full bg-emerald-500"></span>Ideal XI (4-3-3)</h2>
-            <FormationPitch />
-            <div className="mt-3 flex justify-center gap-3 text-xs flex-wrap">
-              <div className="flex items-center gap-1"><div className="w-3 h-3 rounded-full bg-emerald-500"></div><span className="text-slate-400">≥75</span></div>
-              <div className="flex items-center gap-1"><div className="w-3 h-3 rounded-full bg-lime-500"></div><span className="text-slate-400">60-74</span></div>
-              <div className="flex items-center gap-1"><div className="w-3 h-3 rounded-full bg-yellow-500"></div><span className="text-slate-400">45-59</span></div>
-              <div className="flex items-center gap-1"><div className="w-3 h-3 rounded-full bg-red-500"></div><span className="text-slate-400">&lt;45</span></div>
-            </div>
-          </div>
-        </div>
+        try:
+            pd = Config.dataframe_module()
+            df = pd.read_csv(squad_file)
+            cols = {c.lower().replace(" ", "_"): c for c in df.columns}
+            df = df.sort_values(cols["fit_score"], ascending=False)
+            names = df[cols["name"]].tolist()
+            scores = df[cols["fit_score"]].to_numpy(dtype=float)
+            classifications = df[cols["classification"]].tolist()
+        except ImportError:
+            with _open_csv_sequential(squad_file) as f:
+                players = list(csv.DictReader(f))
 
-        <div className="grid grid-cols-1 lg:grid-cols-2 gap-6">
-          <div className="bg-slate-800/40 backdrop-blur border border-slate-700/50 rounded-2xl p-5">
-            <h2 className="text-lg font-semibold mb-4 flex items-center gap-2"><span className="w-2 h-2 rounded-full bg-blue-500"></span>Positional Fit Analysis</h2>
-            {{positionGaps.length > 0 ? <PositionFitBars /> : <div className="text-slate-500 text-center py-4">No positional data</div>}}
-          </div>
+            def _score(p):
+                return float(p.get("fit_score") or p.get("Fit Score") or 0)
 
-          <div className="bg-slate-800/40 backdrop-blur border border-slate-700/50 rounded-2xl p-5">
-            <h2 className="text-lg font-semibold mb-4 flex items-center gap-2"><span className="w-2 h-2 rounded-full bg-red-500"></span>Recruitment Priorities</h2>
-            {{recruitment.length > 0 ? <RecruitmentTable /> : <div className="text-slate-500 text-center py-4">No recruitment priorities</div>}}
-          </div>
-        </div>
+            players.sort(key=_score, reverse=True)
+            names = [p.get("name") or p.get("Name", "") for p in players]
+            scores = [_score(p) for p in players]
+            classifications = [
+                p.get("classification") or p.get("Classification", "")
+                for p in players
+            ]
 
-        <div className="mt-6 bg-slate-800/40 backdrop-blur border border-slate-700/50 rounded-2xl p-5">
-          <h2 className="text-lg font-semibold mb-4 flex items-center gap-2"><span className="w-2 h-2 rounded-full bg-cyan-500"></span>Full Squad Fit Scores</h2>
-          {{squadFit.length > 0 ? <SquadTable /> : <div className="text-slate-500 text-center py-4">No squad data</div>}}
-        </div>
+        if not len(names):
+            print("  ⚠ No squad fit data")
+            return
 
-        <div className="mt-8 pt-6 border-t border-slate-800 flex items-center justify-between text-sm text-slate-500">
-          <div>MTFI Prototype v0.2 • Data Source: StatsBomb</div>
-          <div>Generated: {generated_at}</div>
-        </div>
-      </div>
-    </div>
-  );
-}};
+        fig, ax = self.plt.subplots(figsize=(12, max(8, len(names) * 0.4)))
 
-ReactDOM.render(<MTFIDashboard />, document.getElementById('root'));
-    </script>
-</body>
-</html>'''
-    
-    def _generate_dashboard_html(
-        self,
-        manager: str,
-        primary_formation: str,
-        matches: int,
-        dna_dimensions: Dict,
-        squad_summary: Dict,
-        squad_fit: List,
-        ideal_xi: List,
-        recruitment: List
-    ) -> str:
-        """Generate the HTML content for the dashboard."""
+        colors = [self.COLORS.get(c, self.COLORS["secondary"]) for c in classifications]
+        
+        bars = ax.barh(names, scores, color=colors)
         
-        # Convert data to JSON for embedding
-        dna_json = json.dumps(dna_dimensions)
-        squad_fit_json = json.dumps(squad_fit)
-        ideal_xi_json = json.dumps(ideal_xi)
-        recruitment_json = json.dumps(recruitment)
-        squad_summary_json = json.dumps(squad_summary)
+        # Add score labels
+        for bar, score in zip(bars, scores):
+            ax.text(bar.get_width() + 1, bar.get_y() + bar.get_height()/2,
+                   f"{score:.0f}", va="center", fontsize=9)
         
-        html = f'''<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>AEGIS MTFI Dashboard - {manager}</title>
-    <script src="https://cdn.tailwindcss.com"></script>
-    <script src="https://unpkg.com/react@18/umd/react.production.min.js"></script>
-    <script src="https://unpkg.com/react-dom@18/umd/react-dom.production.min.js"></script>
-    <script src="https://unpkg.com/@babel/standalone/babel.min.js"></script>
-    <style>
-        body {{ font-family: 'Inter', -apple-system, BlinkMacSystemFont, sans-serif; }}
-        .tab-active {{ border-bottom: 3px solid #3b82f6; color: #1e40af; font-weight: 600; }}
-    </style>
-</head>
-<body class="bg-gray-100">
-    <div id="root"></div>
+        ax.set_xlabel("Fit Score")
+        ax.set_xlim(0, 110)
+        ax.set_title("Squad Fit Scores", fontweight="bold", size=14)
+        ax.invert_yaxis()
+        
+        # Legend
+        handles = [self.mpatches.Patch(color=self.COLORS[c], label=c) 
+                  for c in ["Key Enabler", "Good Fit", "System Dependent", "Potentially Marginalised"]]
+        ax.legend(handles=handles, loc="lower right")
+        
+        self.plt.savefig(self.output_dir / "03_squad_fit_scores.png", dpi=self.dpi)
+        self.plt.close()
+        print("  ✓ 03_squad_fit_scores.png")
     
-    <script type="text/babel">
-        const {{ useState }} = React;
+    # =========================================================================
+    # CLASSIFICATION PIE
+    # =========================================================================
+    
+    def plot_classification_pie(self):
+        """Generate classification distribution pie chart."""
+        summary = self.summary
 
-        // ============ EMBEDDED DATA ============
-        const managerName = "{manager}";
-        const primaryFormation = "{primary_formation}";
-        const matchesAnalysed = {matches};
-        const dnaDimensions = {dna_json};
-        const squadSummary = {squad_summary_json};
-        const squadFit = {squad_fit_json};
-        const idealXI = {ideal_xi_json};
-        const recruitment = {recruitment_json};
+        # Build only the non-zero slices in one pass; bail before any
+        # figure is allocated when there is nothing to draw.
+        data = [
+            (label, summary[key], self.COLORS[label])
+            for label, key in self.CLASSIFICATION_KEYS
+            if summary.get(key, 0) > 0
+        ]
+        if not data:
+            return
 
-        // ============ COMPONENTS ============
+        labels, sizes, colors = zip(*data)
         
-        const classificationColors = {{
-            "Key Enabler": "#22c55e",
-            "Good Fit": "#eab308",
-            "System Dependent": "#f97316",
-            "Potentially Marginalised": "#ef4444"
-        }};
+        fig, ax = self.plt.subplots(figsize=(10, 8))
+        
+        wedges, texts, autotexts = ax.pie(
+            sizes, labels=labels, colors=colors, autopct="%1.0f%%",
+            startangle=90, textprops={"fontsize": 11}
+        )
+        
+        ax.set_title("Squad Classification", fontweight="bold", size=14)
+        
+        self.plt.savefig(self.output_dir / "04_classification_pie.png", dpi=self.dpi)
+        self.plt.close()
+        print("  ✓ 04_classification_pie.png")
+    
+    # =========================================================================
+    # IDEAL XI PITCH
+    # =========================================================================
+    
+    def _tier_colors(self, scores):
+        """
+        Vectorized score→colour tiering: >=75 Key Enabler, >=60 Good
+        Fit, else System Dependent.
 
-        const urgencyColors = {{
-            "Critical": "#ef4444",
-            "High": "#f97316",
-            "Medium": "#eab308"
-        }};
+        np.searchsorted against the tier edges maps the whole score
+        array in C, replacing a per-row Python conditional — the part
+        that scales when squads grow to league-wide pools.
 
-        // DNA Radar Chart (SVG)
-        const DNARadar = () => {{
-            const dims = Object.entries(dnaDimensions);
-            const count = dims.length;
-            const angleStep = (2 * Math.PI) / count;
-            const cx = 150, cy = 150, radius = 100;
-            
-            const points = dims.map(([label, value], i) => {{
-                const angle = i * angleStep - Math.PI / 2;
-                const r = (value / 100) * radius;
-                return {{
-                    x: cx + r * Math.cos(angle),
-                    y: cy + r * Math.sin(angle),
-                    labelX: cx + (radius + 25) * Math.cos(angle),
-                    labelY: cy + (radius + 25) * Math.sin(angle),
-                    label,
-                    value
-                }};
-            }});
-            
-            const pathD = points.map((p, i) => `${{i === 0 ? 'M' : 'L'}} ${{p.x}} ${{p.y}}`).join(' ') + ' Z';
+        Args:
+            scores: Array-like of fit scores
+
+        Returns:
+            ndarray of colour hex strings, one per score
+        """
+        table = np.array([
+            self.COLORS["System Dependent"],
+            self.COLORS["Good Fit"],
+            self.COLORS["Key Enabler"],
+        ])
+        return table[np.searchsorted([60, 75], scores, side="right")]
+
+    # Rendered pitch backgrounds keyed by figsize — see _pitch_background().
+    _pitch_cache = {}
+
+    def _pitch_background(self, figsize):
+        """
+        RGBA array of the static pitch (green field, halfway line,
+        centre circle, penalty boxes), rendered once per figsize and
+        cached at class level. Repeat plot_ideal_xi calls blit the
+        array via imshow instead of re-drawing every marking artist.
+        """
+        key = (tuple(figsize), self.dpi)
+        cached = self._pitch_cache.get(key)
+        if cached is not None:
+            return cached
+
+        from matplotlib.collections import PatchCollection
+
+        fig, ax = self.plt.subplots(figsize=figsize, layout="none")
+        ax.set_facecolor("#2d5a27")
+        ax.set_xlim(0, 100)
+        ax.set_ylim(0, 100)
+        ax.axhline(y=50, color="white", linewidth=2, alpha=0.7)
+        # One collection for the markings: a single rasterization pass
+        # instead of three separately drawn patch artists.
+        markings = [
+            self.plt.Circle((50, 50), 10),
+            self.plt.Rectangle((25, 82), 50, 18),
+            self.plt.Rectangle((25, 0), 50, 18),
+        ]
+        ax.add_collection(PatchCollection(
+            markings, facecolors="none", edgecolors="white", linewidths=2, alpha=0.7
+        ))
+        ax.set_aspect("equal")
+        ax.axis("off")
+        fig.patch.set_facecolor("#2d5a27")
+
+        # Crop to the axes box so the array maps 1:1 onto the 0-100
+        # data extent when blitted back. set_aspect only shrinks the
+        # axes box at draw time, so force the layout pass first —
+        # otherwise the pre-draw extent includes the margin the square
+        # aspect is about to give up and the blit squashes the markings.
+        fig.canvas.draw()
+        bbox = ax.get_window_extent().transformed(fig.dpi_scale_trans.inverted())
+        buf = io.BytesIO()
+        fig.savefig(buf, format="png", dpi=self.dpi, facecolor="#2d5a27", bbox_inches=bbox)
+        self.plt.close(fig)
+        buf.seek(0)
+        img = self.plt.imread(buf)
+        self._pitch_cache[key] = img
+        return img
+
+    def plot_ideal_xi(self):
+        """Generate ideal XI pitch visualization."""
+        ideal_xi = self.ideal_xi
+
+        # 4-3-3 positions (x, y coordinates on pitch)
+        positions = {
+            "GK": (50, 92),
+            "LB": (15, 70),
+            "CB1": (35, 75),
+            "CB2": (65, 75),
+            "RB": (85, 70),
+            "DM": (50, 55),
+            "CM": (30, 45),
+            "AM": (70, 45),
+            "LW": (15, 25),
+            "CF": (50, 15),
+            "RW": (85, 25)
+        }
+
+        figsize = (10, 14)
+        # The pitch keeps tight bbox cropping (face colours run to the
+        # figure edge), so constrained layout is switched off here.
+        fig, ax = self.plt.subplots(figsize=figsize, layout="tight")
+
+        # Blit the cached pitch instead of rebuilding its artists
+        ax.set_facecolor("#2d5a27")
+        ax.set_xlim(0, 100)
+        ax.set_ylim(0, 100)
+        ax.imshow(self._pitch_background(figsize), extent=[0, 100, 0, 100], zorder=0)
+
+        # Plot players: one PathCollection for all circles instead of
+        # eleven Circle artists, then the per-player labels.
+        players = [
+            (positions[p.get("position", "")], p.get("fit_score", 0), p.get("name", ""))
+            for p in ideal_xi
+            if p.get("position", "") in positions
+        ]
+        if players:
+            xs = [xy[0] for xy, _, _ in players]
+            ys = [xy[1] for xy, _, _ in players]
+            scores_arr = np.fromiter(
+                (score for _, score, _ in players), dtype=float, count=len(players)
+            )
+            colors = self._tier_colors(scores_arr)
+            # Marker size matching the previous radius-5 circles, via the
+            # data->pixel transform (scatter sizes are in points²).
+            r_px = (ax.transData.transform((5, 0)) - ax.transData.transform((0, 0)))[0]
+            ax.scatter(xs, ys, s=(2 * r_px * 72 / fig.dpi) ** 2, c=colors,
+                       edgecolors="white", linewidths=2, zorder=5)
+
+            for (x, y), score, name in players:
+                # Score in circle
+                ax.text(x, y, f"{score:.0f}", ha="center", va="center",
+                       color="white", fontweight="bold", fontsize=10, zorder=6)
+
+                # Name below
+                ax.text(x, y - 8, name.split()[-1], ha="center", va="center",
+                       color="white", fontsize=9, fontweight="bold",
+                       bbox=dict(boxstyle="round", facecolor="black", alpha=0.5))
+
+        ax.set_aspect("equal")
+        ax.axis("off")
+        ax.set_title("Ideal XI (4-3-3)", fontweight="bold", size=16, color="white", pad=20)
+        
+        fig.patch.set_facecolor("#2d5a27")
+        self.plt.savefig(self.output_dir / "05_ideal_xi_pitch.png", dpi=self.dpi,
+                        bbox_inches="tight", facecolor="#2d5a27")
+        self.plt.close()
+        print("  ✓ 05_ideal_xi_pitch.png")
+    
+    # =========================================================================
+    # RECRUITMENT
+    # =========================================================================
+    
+    def plot_recruitment(self):
+        """Generate recruitment priorities chart."""
+        recruitment = self.recruitment
+        
+        if not recruitment:
+            print("  ⚠ No recruitment priorities")
+            return
+        
+        fig, ax = self.plt.subplots(figsize=(12, max(6, len(recruitment) * 0.8)))
+        
+        positions = [r["position"] for r in recruitment]
+        gaps = [r["gap"] for r in recruitment]
+        urgencies = [r["urgency"] for r in recruitment]
+        
+        colors = {
+            "Critical": "#ef4444",
+            "High": "#f97316",
+            "Medium": "#eab308"
+        }
+        bar_colors = [colors.get(u, "#64748b") for u in urgencies]
+        
+        bars = ax.barh(positions, gaps, color=bar_colors)
+        
+        # Add cost labels
+        for bar, r in zip(bars, recruitment):
+            ax.text(bar.get_width() + 0.5, bar.get_y() + bar.get_height()/2,
+                   f"£{r['cost_low']}M-£{r['cost_high']}M",
+                   va="center", fontsize=10)
+        
+        ax.set_xlabel("Fit Gap (points below 75)")
+        ax.set_title("Recruitment Priorities", fontweight="bold", size=14)
+        ax.set_xlim(0, max(gaps) * 1.5 if gaps else 30)
+        ax.invert_yaxis()
+        
+        # Legend
+        handles = [self.mpatches.Patch(color=colors[u], label=u) for u in ["Critical", "High", "Medium"]]
+        ax.legend(handles=handles, loc="lower right")
+        
+        self.plt.savefig(self.output_dir / "06_recruitment_priorities.png", dpi=self.dpi)
+        self.plt.close()
+        print("  ✓ 06_recruitment_priorities.png")
+    
+    # =========================================================================
+    # EXECUTIVE SUMMARY
+    # =========================================================================
+    
+    def plot_executive_summary(self):
+        """
+        Generate executive summary dashboard.
+
+        The six-panel grid is the most expensive layout in the suite, so
+        the render is memoized on a digest of its inputs: if the PNG on
+        disk was produced from identical data (sidecar .digest file),
+        the matplotlib pass is skipped entirely and regeneration costs
+        one hash instead of a full figure build.
+        """
+        output_file = self.output_dir / "07_executive_summary.png"
+        digest_file = self.output_dir / "07_executive_summary.png.digest"
+        digest = hashlib.blake2b(
+            _json_dumps({
+                "manager": self.results.get("manager", "Unknown"),
+                "matches": self.results.get("matches_analysed", 0),
+                "dna": self.dna,
+                "summary": self.summary,
+                "ideal_xi": self.ideal_xi[:5],
+                "recruitment": self.recruitment,
+                "dpi": self.dpi,
+            }).encode("utf-8"),
+            digest_size=16,
+        ).hexdigest()
+        if output_file.exists() and digest_file.exists():
+            if digest_file.read_text() == digest:
+                print("  ✓ 07_executive_summary.png (inputs unchanged, render skipped)")
+                return
+
+        fig = self.plt.figure(figsize=(16, 12))
+        
+        manager = self.results.get("manager", "Unknown")
+        fig.suptitle(f"Aegis Analysis: {manager}", fontsize=20, fontweight="bold", y=0.98)
+        
+        # Grid layout
+        gs = fig.add_gridspec(2, 3, hspace=0.3, wspace=0.3)
+        
+        # 1. DNA Dimensions (bar chart)
+        ax1 = fig.add_subplot(gs[0, 0])
+        dims = self.dna
+        ax1.barh(list(dims.keys()), list(dims.values()), color=self.COLORS["primary"])
+        ax1.set_xlim(0, 100)
+        ax1.set_title("Manager DNA", fontweight="bold")
+        
+        # 2. Classification (pie)
+        ax2 = fig.add_subplot(gs[0, 1])
+        summary = self.summary
+        data = [
+            (label, summary[key], self.COLORS[label])
+            for label, key in self.CLASSIFICATION_KEYS
+            if summary.get(key, 0) > 0
+        ]
+        if data:
+            labels, sizes, colors = zip(*data)
+            # Abbreviate the two long labels so they fit the small panel
+            labels = [
+                l.replace("System Dependent", "System Dep.")
+                 .replace("Potentially Marginalised", "Marginalised")
+                for l in labels
+            ]
+            ax2.pie(sizes, labels=labels, colors=colors, autopct="%1.0f%%")
+        ax2.set_title("Squad Classification", fontweight="bold")
+        
+        # 3. Key Metrics
+        ax3 = fig.add_subplot(gs[0, 2])
+        ax3.axis("off")
+        metrics_text = f"""
+        Matches Analysed: {self.results.get('matches_analysed', 0)}
+        
+        Squad Size: {summary.get('total', 0)}
+        
+        Average Fit: {summary.get('average_fit', 0):.1f}
+        
+        Key Enablers: {summary.get('key_enablers', 0)}
+        """
+        ax3.text(0.1, 0.5, metrics_text, fontsize=14, verticalalignment="center",
+                fontfamily="monospace")
+        ax3.set_title("Key Metrics", fontweight="bold")
+        
+        # 4. Top 5 Fits
+        ax4 = fig.add_subplot(gs[1, 0])
+        ideal = self.ideal_xi[:5]
+        if ideal:
+            names = [p["name"].split()[-1] for p in ideal]
+            scores = [p["fit_score"] for p in ideal]
+            ax4.barh(names, scores, color=self.COLORS["Key Enabler"])
+            ax4.set_xlim(0, 100)
+        ax4.set_title("Top 5 Fit Scores", fontweight="bold")
+        ax4.invert_yaxis()
+        
+        # 5. Recruitment
+        ax5 = fig.add_subplot(gs[1, 1])
+        recruitment = self.recruitment[:4]
+        if recruitment:
+            positions = [r["position"] for r in recruitment]
+            gaps = [r["gap"] for r in recruitment]
+            ax5.barh(positions, gaps, color="#f97316")
+        ax5.set_title("Top Recruitment Needs", fontweight="bold")
+        ax5.invert_yaxis()
+        
+        # 6. Investment Summary
+        ax6 = fig.add_subplot(gs[1, 2])
+        ax6.axis("off")
+        total_low = self.total_invest_low
+        total_high = self.total_invest_high
+        
+        investment_text = f"""
+        Total Investment Required:
+        
+        £{total_low}M - £{total_high}M
+        
+        Priority Signings: {len(self.recruitment)}
+        """
+        ax6.text(0.1, 0.5, investment_text, fontsize=14, verticalalignment="center",
+                fontfamily="monospace")
+        ax6.set_title("Investment Summary", fontweight="bold")
+        
+        self.plt.savefig(output_file, dpi=self.dpi)
+        self.plt.close()
+        digest_file.write_text(digest)
+        print("  ✓ 07_executive_summary.png")
+
+
+def _pool_init():
+    """
+    Worker bootstrap for plot_all's process pool.
+
+    Forces the headless Agg backend before matplotlib is touched (spawn
+    contexts don't inherit the parent's backend choice) and pays the
+    pyplot import during pool spin-up, so the first render task in each
+    worker isn't charged the ~200 ms import + font-cache cost.
+    """
+    os.environ.setdefault("MPLBACKEND", "Agg")
+    try:
+        import matplotlib.pyplot  # noqa: F401
+    except ImportError:
+        pass  # reported per-chart by the visualizer's plt property
+
+
+def _render_figure(name: str, results: Dict, output_dir: Path, dpi: int = 100):
+    """
+    Render one chart in a worker process (see plot_all).
+
+    Module-level so it pickles by reference. A fresh visualizer is built
+    inside the worker: matplotlib is imported there under the Agg
+    backend, so forked workers don't fight over one pyplot state or a
+    shared font cache, and any CSV a chart needs is lazy-loaded in the
+    worker via the squad_fit_data property.
+
+    Args:
+        name: Chart name from AegisVisualizer.CHART_NAMES
+        results: Parsed aegis_analysis.json (plain JSON — pickles fine)
+        output_dir: Directory the PNG is written to
+    """
+    os.environ.setdefault("MPLBACKEND", "Agg")
+    viz = AegisVisualizer(output_dir=output_dir, dpi=dpi)
+    viz.results = results
+    getattr(viz, f"plot_{name}")()
+
+
+# =============================================================================
+# STANDALONE CONVENIENCE FUNCTION
+# =============================================================================
+
+# ---------------------------------------------------------------------------
+# Legacy dashboard template, pre-split at its data-substitution points.
+#
+# The static HTML/JSX lives in module-level literals (allocated once per
+# process, single braces) and _generate_dashboard_html interleaves them
+# with the per-dashboard values: manager (title), manager, formation,
+# match count, then the five JSON payloads.
+# ---------------------------------------------------------------------------
+_LEGACY_DASHBOARD_STATIC = (
+'''<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>AEGIS MTFI Dashboard - ''',
+'''</title>
+    <script src="https://cdn.tailwindcss.com"></script>
+    <script src="https://unpkg.com/react@18/umd/react.production.min.js"></script>
+    <script src="https://unpkg.com/react-dom@18/umd/react-dom.production.min.js"></script>
+    <script src="https://unpkg.com/react-window@1.8.10/dist/index-prod.umd.js"></script>
+''',
+'''    <style>
+        body { font-family: 'Inter', -apple-system, BlinkMacSystemFont, sans-serif; }
+        .tab-active { border-bottom: 3px solid #3b82f6; color: #1e40af; font-weight: 600; }
+''' + _DASHBOARD_COLOR_CSS + '''    </style>
+</head>
+<body class="bg-gray-100">
+    <div id="root"></div>
+
+    <script>
+        const { useState } = React;
+
+        // ============ EMBEDDED DATA ============
+        const managerName = "''',
+'''";
+        const primaryFormation = "''',
+'''";
+        const matchesAnalysed = ''',
+''';
+
+        // Precomputed in Python (see _generate_dashboard_html) so the
+        // browser never sorts or reduces the squad arrays per render.
+        const avgFit = ''',
+''';
+        const xiAvgFit = ''',
+''';
+        const totalInvestLow = ''',
+''';
+        const totalInvestHigh = ''',
+''';
+        const classificationCounts = ''',
+''';
+
+        // The bulky array payloads ship deflate-compressed + base64
+        // (see _generate_dashboard_html) and are inflated natively via
+        // DecompressionStream before the first render.
+        const payloadB64 = "''',
+'''";
+        let dnaDimensions, squadSummary, squadFit, idealXI, recruitment,
+            squadFitSorted, squadFitTop15, recruitmentByWindow;
+
+        async function inflatePayload() {
+            const bytes = Uint8Array.from(atob(payloadB64), (c) => c.charCodeAt(0));
+            const stream = new Blob([bytes]).stream()
+                .pipeThrough(new DecompressionStream('deflate'));
+            const data = JSON.parse(await new Response(stream).text());
+            ({ dnaDimensions, squadSummary, squadFit, idealXI, recruitment,
+               squadFitSorted, squadFitTop15, recruitmentByWindow } = data);
+        }
+    </script>
+
+    ''',
+'''
+</body>
+</html>''',
+)
+
+# JSX source for the legacy dashboard's React components, kept out of the
+# static chunks so it can be pre-transpiled to plain JS at generation time
+# (see _compile_jsx). The data script above declares its consts at top
+# level, so they remain visible to this later script block.
+_LEGACY_DASHBOARD_JSX = '''\
+        // ============ COMPONENTS ============
+        
+        // Frozen module-scope constants: V8's inline caches stabilise on
+        // frozen shapes, and nothing is rebuilt per component render.
+        const classificationColors = Object.freeze({
+            "Key Enabler": "#22c55e",
+            "Good Fit": "#eab308",
+            "System Dependent": "#f97316",
+            "Potentially Marginalised": "#ef4444"
+        });
+
+        const POSITIONS = Object.freeze({
+            "GK": { x: 50, y: 90 },
+            "LB": { x: 15, y: 70 },
+            "CB1": { x: 35, y: 75 },
+            "CB2": { x: 65, y: 75 },
+            "RB": { x: 85, y: 70 },
+            "DM": { x: 50, y: 55 },
+            "CM": { x: 30, y: 45 },
+            "AM": { x: 70, y: 45 },
+            "LW": { x: 15, y: 25 },
+            "CF": { x: 50, y: 15 },
+            "RW": { x: 85, y: 25 }
+        });
+
+        // Matches the generated .cls-* / .urgency-* rules in <style>
+        const slug = (s) => s.toLowerCase().replace(/[^a-z0-9]+/g, '-').replace(/^-+|-+$/g, '');
+
+        // DNA Radar Chart (SVG)
+        const DNARadar = () => {
+            const dims = Object.entries(dnaDimensions);
+            const count = dims.length;
+            const angleStep = (2 * Math.PI) / count;
+            const cx = 150, cy = 150, radius = 100;
+            
+            const points = dims.map(([label, value], i) => {
+                const angle = i * angleStep - Math.PI / 2;
+                const r = (value / 100) * radius;
+                return {
+                    x: cx + r * Math.cos(angle),
+                    y: cy + r * Math.sin(angle),
+                    labelX: cx + (radius + 25) * Math.cos(angle),
+                    labelY: cy + (radius + 25) * Math.sin(angle),
+                    label,
+                    value
+                };
+            });
+            
+            const pathD = points.map((p, i) => `${i === 0 ? 'M' : 'L'} ${p.x} ${p.y}`).join(' ') + ' Z';
             
             // Grid circles
             const gridCircles = [25, 50, 75, 100].map(pct => (
-                <circle key={{pct}} cx={{cx}} cy={{cy}} r={{radius * pct / 100}} 
+                <circle key={pct} cx={cx} cy={cy} r={radius * pct / 100} 
                     fill="none" stroke="#e5e7eb" strokeWidth="1" />
             ));
             
             // Grid lines
-            const gridLines = dims.map((_, i) => {{
+            const gridLines = dims.map((_, i) => {
                 const angle = i * angleStep - Math.PI / 2;
                 return (
-                    <line key={{i}} x1={{cx}} y1={{cy}} 
-                        x2={{cx + radius * Math.cos(angle)}} 
-                        y2={{cy + radius * Math.sin(angle)}}
+                    <line key={i} x1={cx} y1={cy} 
+                        x2={cx + radius * Math.cos(angle)} 
+                        y2={cy + radius * Math.sin(angle)}
                         stroke="#e5e7eb" strokeWidth="1" />
                 );
-            }});
+            });
 
             return (
                 <svg viewBox="0 0 300 300" className="w-full max-w-md mx-auto">
-                    {{gridCircles}}
-                    {{gridLines}}
-                    <path d={{pathD}} fill="rgba(59, 130, 246, 0.25)" stroke="#3b82f6" strokeWidth="2" />
-                    {{points.map((p, i) => (
-                        <g key={{i}}>
-                            <circle cx={{p.x}} cy={{p.y}} r="5" fill="#3b82f6" />
-                            <text x={{p.labelX}} y={{p.labelY}} textAnchor="middle" 
+                    {gridCircles}
+                    {gridLines}
+                    <path d={pathD} fill="rgba(59, 130, 246, 0.25)" stroke="#3b82f6" strokeWidth="2" />
+                    {points.map((p, i) => (
+                        <g key={i}>
+                            <circle cx={p.x} cy={p.y} r="5" fill="#3b82f6" />
+                            <text x={p.labelX} y={p.labelY} textAnchor="middle" 
                                 dominantBaseline="middle" className="text-xs fill-gray-600">
-                                {{p.label}}
+                                {p.label}
                             </text>
-                            <text x={{p.x}} y={{p.y - 12}} textAnchor="middle" 
+                            <text x={p.x} y={p.y - 12} textAnchor="middle" 
                                 className="text-xs font-bold fill-blue-600">
-                                {{p.value.toFixed(0)}}
+                                {p.value.toFixed(0)}
                             </text>
                         </g>
-                    ))}}
+                    ))}
                 </svg>
             );
-        }};
+        };
 
         // Ideal XI Pitch
-        const IdealXIPitch = () => {{
-            const positions = {{
-                "GK": {{ x: 50, y: 90 }},
-                "LB": {{ x: 15, y: 70 }},
-                "CB1": {{ x: 35, y: 75 }},
-                "CB2": {{ x: 65, y: 75 }},
-                "RB": {{ x: 85, y: 70 }},
-                "DM": {{ x: 50, y: 55 }},
-                "CM": {{ x: 30, y: 45 }},
-                "AM": {{ x: 70, y: 45 }},
-                "LW": {{ x: 15, y: 25 }},
-                "CF": {{ x: 50, y: 15 }},
-                "RW": {{ x: 85, y: 25 }}
-            }};
-
+        const IdealXIPitch = () => {
             return (
-                <div className="relative bg-green-700 rounded-lg p-4" style={{{{aspectRatio: '3/4'}}}}>
-                    {{/* Pitch markings */}}
+                <div className="relative bg-green-700 rounded-lg p-4" style={{aspectRatio: '3/4'}}>
+                    {/* Pitch markings */}
                     <div className="absolute inset-4 border-2 border-white/50 rounded">
                         <div className="absolute top-1/2 left-0 right-0 border-t-2 border-white/50"></div>
                         <div className="absolute top-1/2 left-1/2 -translate-x-1/2 -translate-y-1/2 w-16 h-16 border-2 border-white/50 rounded-full"></div>
                     </div>
                     
-                    {{/* Players */}}
-                    {{idealXI.map((player, i) => {{
-                        const pos = positions[player.position];
+                    {/* Players */}
+                    {idealXI.map((player, i) => {
+                        const pos = POSITIONS[player.position];
                         if (!pos) return null;
                         
                         const score = player.fit_score || 0;
@@ -982,52 +1724,120 @@ ReactDOM.render(<MTFIDashboard />, document.getElementById('root'));
                         const name = player.name?.split(' ').pop() || 'Unknown';
                         
                         return (
-                            <div key={{i}} className="absolute transform -translate-x-1/2 -translate-y-1/2"
-                                style={{{{ left: `${{pos.x}}%`, top: `${{pos.y}}%` }}}}>
-                                <div className={{`w-10 h-10 rounded-full ${{bgColor}} border-2 border-white flex items-center justify-center text-white font-bold text-sm shadow-lg`}}>
-                                    {{score.toFixed(0)}}
+                            <div key={i} className="absolute transform -translate-x-1/2 -translate-y-1/2"
+                                style={{ left: `${pos.x}%`, top: `${pos.y}%` }}>
+                                <div className={`w-10 h-10 rounded-full ${bgColor} border-2 border-white flex items-center justify-center text-white font-bold text-sm shadow-lg`}>
+                                    {score.toFixed(0)}
                                 </div>
                                 <div className="text-white text-xs font-medium mt-1 text-center bg-black/40 px-1 rounded">
-                                    {{name}}
+                                    {name}
                                 </div>
                             </div>
                         );
-                    }})}}
+                    })}
                 </div>
             );
-        }};
+        };
 
         // Squad Fit Bar Chart
-        const SquadFitChart = () => {{
-            const sorted = [...squadFit].sort((a, b) => b.score - a.score).slice(0, 15);
+        const SquadFitChart = () => {
+            const sorted = squadFitTop15;
             const maxScore = Math.max(...sorted.map(p => p.score), 100);
             
             return (
                 <div className="space-y-2">
-                    {{sorted.map((player, i) => (
-                        <div key={{i}} className="flex items-center gap-2">
-                            <div className="w-32 text-sm truncate">{{player.name}}</div>
+                    {sorted.map((player, i) => (
+                        <div key={i} className="flex items-center gap-2">
+                            <div className="w-32 text-sm truncate">{player.name}</div>
                             <div className="flex-1 bg-gray-200 rounded-full h-6 relative">
-                                <div className="h-full rounded-full transition-all"
-                                    style={{{{
-                                        width: `${{(player.score / maxScore) * 100}}%`,
-                                        backgroundColor: classificationColors[player.classification]
-                                    }}}}>
+                                <div className={`h-full rounded-full transition-all cls-${slug(player.classification)}`}
+                                    style={{ width: `${(player.score / maxScore) * 100}%` }}>
                                 </div>
                                 <span className="absolute right-2 top-1/2 -translate-y-1/2 text-xs font-medium">
-                                    {{player.score.toFixed(0)}}
+                                    {player.score.toFixed(0)}
                                 </span>
                             </div>
                         </div>
-                    ))}}
+                    ))}
                 </div>
             );
-        }};
+        };
 
-        // Recruitment Table
-        const RecruitmentTable = () => (
-            <table className="w-full text-sm">
-                <thead>
+        // Full squad listing. When react-window loaded from the CDN the
+        // rows are virtualized (DOM nodes bounded by the viewport, not
+        // the squad size); otherwise the plain table renders as before.
+        const SquadVirtualRow = ({ index, style }) => {
+            const p = squadFitSorted[index];
+            return (
+                <div style={style} className="flex items-center text-sm border-b hover:bg-gray-50">
+                    <div className="flex-1 px-1 font-medium truncate">{p.name}</div>
+                    <div className="w-24 px-1">{p.position}</div>
+                    <div className="w-12 px-1">{p.age}</div>
+                    <div className="w-16 px-1 font-bold">{p.score.toFixed(0)}</div>
+                    <div className="w-44 px-1">
+                        <span className={`px-2 py-1 rounded text-xs text-white cls-${slug(p.classification)}`}>
+                            {p.classification}
+                        </span>
+                    </div>
+                </div>
+            );
+        };
+
+        const FullSquadTable = () => {
+            if (typeof ReactWindow !== 'undefined' && ReactWindow.FixedSizeList) {
+                const List = ReactWindow.FixedSizeList;
+                return (
+                    <div className="text-sm">
+                        <div className="flex font-bold border-b pb-2">
+                            <div className="flex-1 px-1">Player</div>
+                            <div className="w-24 px-1">Position</div>
+                            <div className="w-12 px-1">Age</div>
+                            <div className="w-16 px-1">Fit Score</div>
+                            <div className="w-44 px-1">Classification</div>
+                        </div>
+                        <List height={600} itemCount={squadFitSorted.length} itemSize={40} width="100%">
+                            {SquadVirtualRow}
+                        </List>
+                    </div>
+                );
+            }
+            // Make a broken CDN load visible instead of silently
+            // degrading to the unvirtualized table.
+            console.warn('react-window not loaded; rendering full squad table unvirtualized');
+            return (
+                <table className="w-full text-sm">
+                    <thead>
+                        <tr className="border-b">
+                            <th className="text-left py-2">Player</th>
+                            <th className="text-left py-2">Position</th>
+                            <th className="text-left py-2">Age</th>
+                            <th className="text-left py-2">Fit Score</th>
+                            <th className="text-left py-2">Classification</th>
+                        </tr>
+                    </thead>
+                    <tbody>
+                        {squadFitSorted.map((p, i) => (
+                            <tr key={i} className="border-b hover:bg-gray-50">
+                                <td className="py-2 font-medium">{p.name}</td>
+                                <td className="py-2">{p.position}</td>
+                                <td className="py-2">{p.age}</td>
+                                <td className="py-2 font-bold">{p.score.toFixed(0)}</td>
+                                <td className="py-2">
+                                    <span className={`px-2 py-1 rounded text-xs text-white cls-${slug(p.classification)}`}>
+                                        {p.classification}
+                                    </span>
+                                </td>
+                            </tr>
+                        ))}
+                    </tbody>
+                </table>
+            );
+        };
+
+        // Recruitment Table
+        const RecruitmentTable = () => (
+            <table className="w-full text-sm">
+                <thead>
                     <tr className="border-b">
                         <th className="text-left py-2">Position</th>
                         <th className="text-left py-2">Gap</th>
@@ -1037,42 +1847,32 @@ ReactDOM.render(<MTFIDashboard />, document.getElementById('root'));
                     </tr>
                 </thead>
                 <tbody>
-                    {{recruitment.map((r, i) => (
-                        <tr key={{i}} className="border-b hover:bg-gray-50">
-                            <td className="py-2 font-medium">{{r.position}}</td>
-                            <td className="py-2">{{r.gap?.toFixed(1)}}</td>
+                    {recruitment.map((r, i) => (
+                        <tr key={i} className="border-b hover:bg-gray-50">
+                            <td className="py-2 font-medium">{r.position}</td>
+                            <td className="py-2">{r.gap?.toFixed(1)}</td>
                             <td className="py-2">
-                                <span className="px-2 py-1 rounded text-xs text-white"
-                                    style={{{{ backgroundColor: urgencyColors[r.urgency] }}}}>
-                                    {{r.urgency}}
+                                <span className={`px-2 py-1 rounded text-xs text-white urgency-${slug(r.urgency)}`}>
+                                    {r.urgency}
                                 </span>
                             </td>
-                            <td className="py-2">{{r.timeline}}</td>
-                            <td className="py-2 text-right">£{{r.cost_low}}M - £{{r.cost_high}}M</td>
+                            <td className="py-2">{r.timeline}</td>
+                            <td className="py-2 text-right">£{r.cost_low}M - £{r.cost_high}M</td>
                         </tr>
-                    ))}}
+                    ))}
                 </tbody>
             </table>
         );
 
         // Main Dashboard
-        const Dashboard = () => {{
+        const Dashboard = () => {
             const [tab, setTab] = useState('overview');
-            
-            const avgFit = squadFit.length > 0 
-                ? (squadFit.reduce((a, b) => a + b.score, 0) / squadFit.length).toFixed(1)
-                : 0;
-            
-            const xiAvgFit = idealXI.length > 0
-                ? (idealXI.reduce((a, b) => a + (b.fit_score || 0), 0) / idealXI.length).toFixed(1)
-                : 0;
-
-            const totalInvestLow = recruitment.reduce((a, b) => a + (b.cost_low || 0), 0);
-            const totalInvestHigh = recruitment.reduce((a, b) => a + (b.cost_high || 0), 0);
+            // avgFit / xiAvgFit / totalInvestLow / totalInvestHigh are
+            // embedded top-level constants, precomputed in Python.
 
             return (
                 <div className="min-h-screen bg-gray-100">
-                    {{/* Header */}}
+                    {/* Header */}
                     <header className="bg-gradient-to-r from-blue-900 to-blue-700 text-white p-6 shadow-xl">
                         <div className="max-w-7xl mx-auto flex justify-between items-center">
                             <div>
@@ -1081,49 +1881,49 @@ ReactDOM.render(<MTFIDashboard />, document.getElementById('root'));
                             </div>
                             <div className="text-right">
                                 <p className="text-sm text-blue-200">Scenario Analysis</p>
-                                <p className="text-xl font-semibold">{{managerName}}</p>
+                                <p className="text-xl font-semibold">{managerName}</p>
                             </div>
                         </div>
                     </header>
 
-                    {{/* Navigation */}}
+                    {/* Navigation */}
                     <nav className="bg-white shadow-sm sticky top-0 z-10">
                         <div className="max-w-7xl mx-auto flex">
-                            {{[
-                                {{ id: 'overview', label: '📊 Overview' }},
-                                {{ id: 'dna', label: '🧬 Manager DNA' }},
-                                {{ id: 'squad', label: '👥 Squad Fit' }},
-                                {{ id: 'recruitment', label: '🎯 Recruitment' }}
+                            {[
+                                { id: 'overview', label: '📊 Overview' },
+                                { id: 'dna', label: '🧬 Manager DNA' },
+                                { id: 'squad', label: '👥 Squad Fit' },
+                                { id: 'recruitment', label: '🎯 Recruitment' }
                             ].map(t => (
-                                <button key={{t.id}} onClick={{() => setTab(t.id)}}
-                                    className={{`px-6 py-4 text-sm font-medium transition-colors
-                                        ${{tab === t.id ? 'tab-active bg-blue-50' : 'text-gray-600 hover:bg-gray-50'}}`}}>
-                                    {{t.label}}
+                                <button key={t.id} onClick={() => setTab(t.id)}
+                                    className={`px-6 py-4 text-sm font-medium transition-colors
+                                        ${tab === t.id ? 'tab-active bg-blue-50' : 'text-gray-600 hover:bg-gray-50'}`}>
+                                    {t.label}
                                 </button>
-                            ))}}
+                            ))}
                         </div>
                     </nav>
 
-                    {{/* Content */}}
+                    {/* Content */}
                     <main className="max-w-7xl mx-auto p-6">
-                        {{tab === 'overview' && (
+                        {tab === 'overview' && (
                             <div className="space-y-6">
                                 <div className="grid grid-cols-1 md:grid-cols-4 gap-4">
                                     <div className="bg-white rounded-xl p-6 shadow-sm">
                                         <p className="text-gray-500 text-sm">Matches Analysed</p>
-                                        <p className="text-3xl font-bold text-blue-600">{{matchesAnalysed}}</p>
+                                        <p className="text-3xl font-bold text-blue-600">{matchesAnalysed}</p>
                                     </div>
                                     <div className="bg-white rounded-xl p-6 shadow-sm">
                                         <p className="text-gray-500 text-sm">Primary Formation</p>
-                                        <p className="text-3xl font-bold text-blue-600">{{primaryFormation}}</p>
+                                        <p className="text-3xl font-bold text-blue-600">{primaryFormation}</p>
                                     </div>
                                     <div className="bg-white rounded-xl p-6 shadow-sm">
                                         <p className="text-gray-500 text-sm">Squad Avg Fit</p>
-                                        <p className="text-3xl font-bold text-blue-600">{{avgFit}}</p>
+                                        <p className="text-3xl font-bold text-blue-600">{avgFit}</p>
                                     </div>
                                     <div className="bg-white rounded-xl p-6 shadow-sm">
                                         <p className="text-gray-500 text-sm">Key Enablers</p>
-                                        <p className="text-3xl font-bold text-green-600">{{squadSummary.key_enablers || 0}}</p>
+                                        <p className="text-3xl font-bold text-green-600">{squadSummary.key_enablers || 0}</p>
                                     </div>
                                 </div>
                                 
@@ -1133,31 +1933,31 @@ ReactDOM.render(<MTFIDashboard />, document.getElementById('root'));
                                         <DNARadar />
                                     </div>
                                     <div className="bg-white rounded-xl p-6 shadow-sm">
-                                        <h2 className="text-lg font-bold mb-4">Ideal XI ({{primaryFormation}})</h2>
+                                        <h2 className="text-lg font-bold mb-4">Ideal XI ({primaryFormation})</h2>
                                         <IdealXIPitch />
-                                        <p className="text-center text-sm text-gray-500 mt-2">Average Fit: {{xiAvgFit}}</p>
+                                        <p className="text-center text-sm text-gray-500 mt-2">Average Fit: {xiAvgFit}</p>
                                     </div>
                                 </div>
 
                                 <div className="bg-white rounded-xl p-6 shadow-sm">
                                     <h2 className="text-lg font-bold mb-4">Squad Classification</h2>
                                     <div className="grid grid-cols-2 md:grid-cols-4 gap-4">
-                                        {{Object.entries(classificationColors).map(([cls, color]) => {{
-                                            const count = squadFit.filter(p => p.classification === cls).length;
+                                        {Object.entries(classificationColors).map(([cls, color]) => {
+                                            const count = classificationCounts[cls] || 0;
                                             return (
-                                                <div key={{cls}} className="text-center p-4 rounded-lg" 
-                                                    style={{{{ backgroundColor: color + '20' }}}}>
-                                                    <p className="text-3xl font-bold" style={{{{ color }}}}>{{count}}</p>
-                                                    <p className="text-sm text-gray-600">{{cls}}</p>
+                                                <div key={cls} className="text-center p-4 rounded-lg" 
+                                                    style={{ backgroundColor: color + '20' }}>
+                                                    <p className="text-3xl font-bold" style={{ color }}>{count}</p>
+                                                    <p className="text-sm text-gray-600">{cls}</p>
                                                 </div>
                                             );
-                                        }})}}
+                                        })}
                                     </div>
                                 </div>
                             </div>
-                        )}}
+                        )}
 
-                        {{tab === 'dna' && (
+                        {tab === 'dna' && (
                             <div className="space-y-6">
                                 <div className="bg-white rounded-xl p-6 shadow-sm">
                                     <h2 className="text-lg font-bold mb-4">Manager DNA Radar</h2>
@@ -1166,23 +1966,23 @@ ReactDOM.render(<MTFIDashboard />, document.getElementById('root'));
                                 <div className="bg-white rounded-xl p-6 shadow-sm">
                                     <h2 className="text-lg font-bold mb-4">DNA Dimensions</h2>
                                     <div className="space-y-3">
-                                        {{Object.entries(dnaDimensions).map(([dim, value]) => (
-                                            <div key={{dim}} className="flex items-center gap-4">
-                                                <div className="w-40 font-medium">{{dim}}</div>
+                                        {Object.entries(dnaDimensions).map(([dim, value]) => (
+                                            <div key={dim} className="flex items-center gap-4">
+                                                <div className="w-40 font-medium">{dim}</div>
                                                 <div className="flex-1 bg-gray-200 rounded-full h-4">
                                                     <div className="bg-blue-500 h-full rounded-full"
-                                                        style={{{{ width: `${{value}}%` }}}}>
+                                                        style={{ width: `${value}%` }}>
                                                     </div>
                                                 </div>
-                                                <div className="w-12 text-right font-bold">{{value.toFixed(0)}}</div>
+                                                <div className="w-12 text-right font-bold">{value.toFixed(0)}</div>
                                             </div>
-                                        ))}}
+                                        ))}
                                     </div>
                                 </div>
                             </div>
-                        )}}
+                        )}
 
-                        {{tab === 'squad' && (
+                        {tab === 'squad' && (
                             <div className="space-y-6">
                                 <div className="bg-white rounded-xl p-6 shadow-sm">
                                     <h2 className="text-lg font-bold mb-4">Ideal Starting XI</h2>
@@ -1194,66 +1994,40 @@ ReactDOM.render(<MTFIDashboard />, document.getElementById('root'));
                                 </div>
                                 <div className="bg-white rounded-xl p-6 shadow-sm">
                                     <h2 className="text-lg font-bold mb-4">Full Squad</h2>
-                                    <table className="w-full text-sm">
-                                        <thead>
-                                            <tr className="border-b">
-                                                <th className="text-left py-2">Player</th>
-                                                <th className="text-left py-2">Position</th>
-                                                <th className="text-left py-2">Age</th>
-                                                <th className="text-left py-2">Fit Score</th>
-                                                <th className="text-left py-2">Classification</th>
-                                            </tr>
-                                        </thead>
-                                        <tbody>
-                                            {{[...squadFit].sort((a, b) => b.score - a.score).map((p, i) => (
-                                                <tr key={{i}} className="border-b hover:bg-gray-50">
-                                                    <td className="py-2 font-medium">{{p.name}}</td>
-                                                    <td className="py-2">{{p.position}}</td>
-                                                    <td className="py-2">{{p.age}}</td>
-                                                    <td className="py-2 font-bold">{{p.score.toFixed(0)}}</td>
-                                                    <td className="py-2">
-                                                        <span className="px-2 py-1 rounded text-xs text-white"
-                                                            style={{{{ backgroundColor: classificationColors[p.classification] }}}}>
-                                                            {{p.classification}}
-                                                        </span>
-                                                    </td>
-                                                </tr>
-                                            ))}}
-                                        </tbody>
-                                    </table>
+                                    <FullSquadTable />
                                 </div>
                             </div>
-                        )}}
+                        )}
 
-                        {{tab === 'recruitment' && (
+                        {tab === 'recruitment' && (
                             <div className="space-y-6">
                                 <div className="grid grid-cols-1 md:grid-cols-2 gap-4">
                                     <div className="bg-red-50 border border-red-200 rounded-xl p-6">
                                         <h3 className="font-bold text-red-800 mb-2">🔴 January Window</h3>
                                         <p className="text-3xl font-bold text-red-600">
-                                            {{recruitment.filter(r => r.timeline === 'January').length}} Signings
+                                            {(recruitmentByWindow.January || []).length} Signings
                                         </p>
                                         <ul className="mt-2 space-y-1 text-sm">
-                                            {{recruitment.filter(r => r.timeline === 'January').map((r, i) => (
-                                                <li key={{i}} className="flex justify-between">
-                                                    <span>{{r.position}}</span>
-                                                    <span className="font-medium">£{{r.cost_low}}M - £{{r.cost_high}}M</span>
+                                            {(recruitmentByWindow.January || []).map((r, i) => (
+                                                <li key={i} className="flex justify-between">
+                                                    <span>{r.position}</span>
+                                                    <span className="font-medium">£{r.cost_low}M - £{r.cost_high}M</span>
                                                 </li>
-                                            ))}}
+                                            ))}
                                         </ul>
                                     </div>
                                     <div className="bg-orange-50 border border-orange-200 rounded-xl p-6">
                                         <h3 className="font-bold text-orange-800 mb-2">🟠 Summer Window</h3>
                                         <p className="text-3xl font-bold text-orange-600">
-                                            {{recruitment.filter(r => r.timeline === 'Summer').length}} Signings
+                                            {(recruitmentByWindow.Summer || []).length} Signings
                                         </p>
                                         <ul className="mt-2 space-y-1 text-sm">
-                                            {{recruitment.filter(r => r.timeline === 'Summer').map((r, i) => (
-                                                <li key={{i}} className="flex justify-between">
-                                                    <span>{{r.position}}</span>
-                                                    <span className="font-medium">£{{r.cost_low}}M - £{{r.cost_high}}M</span>
+                                            {(recruitmentByWindow.Summer || []).map((r, i) => (
+                                                <li key={i} className="flex justify-between">
+                                                    <span>{r.position}</span>
+                                                    <span className="font-medium">£{r.cost_low}M - £{r.cost_high}M</span>
                                                 </li>
-                                            ))}}
+                                            ))}
                                         </ul>
                                     </div>
                                 </div>
@@ -1266,17 +2040,17 @@ ReactDOM.render(<MTFIDashboard />, document.getElementById('root'));
                                 <div className="bg-blue-50 border border-blue-200 rounded-xl p-6">
                                     <h3 className="font-bold text-blue-800 mb-2">💰 Total Investment Required</h3>
                                     <p className="text-4xl font-bold text-blue-600">
-                                        £{{totalInvestLow}}M - £{{totalInvestHigh}}M
+                                        £{totalInvestLow}M - £{totalInvestHigh}M
                                     </p>
                                     <p className="text-sm text-blue-600 mt-1">
-                                        Across {{recruitment.length}} priority positions
+                                        Across {recruitment.length} priority positions
                                     </p>
                                 </div>
                             </div>
-                        )}}
+                        )}
                     </main>
 
-                    {{/* Footer */}}
+                    {/* Footer */}
                     <footer className="bg-gray-800 text-gray-400 p-6 mt-12">
                         <div className="max-w-7xl mx-auto text-center">
                             <p className="text-sm">
@@ -1288,413 +2062,370 @@ ReactDOM.render(<MTFIDashboard />, document.getElementById('root'));
                     </footer>
                 </div>
             );
-        }};
+        };
+
+        inflatePayload().then(() => {
+            ReactDOM.render(<Dashboard />, document.getElementById('root'));
+        });
+'''
+
+# ---------------------------------------------------------------------------
+# Dashboard v2 template, pre-split at its ten substitution points (same
+# treatment as the legacy template above): manager, DNA pillars,
+# clusters, managers scatter, squad fit, ideal XI, positional gaps,
+# recruitment, season label, generation timestamp.
+# ---------------------------------------------------------------------------
+_DASHBOARD_V2_STATIC = (
+'''<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>MTFI Dashboard v2</title>
+    <script src="https://cdn.tailwindcss.com"></script>
+    <script src="https://unpkg.com/react@18/umd/react.production.min.js"></script>
+    <script src="https://unpkg.com/react-dom@18/umd/react-dom.production.min.js"></script>
+    <script src="https://unpkg.com/@babel/standalone/babel.min.js"></script>
+    <style>body { margin: 0; } * { box-sizing: border-box; }</style>
+</head>
+<body>
+    <div id="root"></div>
+    <script type="text/babel">
+const { useState } = React;
+
+const MTFIDashboard = () => {
+  const managerData = ''',
+''';
+  const dnaPillars = ''',
+''';
+  const clusters = ''',
+''';
+  const allManagers = ''',
+''';
+  const squadFit = ''',
+''';
+  const idealXI = ''',
+''';
+  const positionGaps = ''',
+''';
+  const recruitment = ''',
+''';
+  const season = "''',
+'''";
+
+  const totalPlayers = squadFit.length;
+  const keyEnablers = squadFit.filter(p => p.fit >= 75).length;
+  const goodFit = squadFit.filter(p => p.fit >= 60 && p.fit < 75).length;
+  const systemDependent = squadFit.filter(p => p.fit >= 45 && p.fit < 60).length;
+  const marginalised = squadFit.filter(p => p.fit < 45).length;
+  const avgFit = totalPlayers > 0 ? (squadFit.reduce((a, b) => a + b.fit, 0) / totalPlayers).toFixed(1) : 0;
+  const investmentLow = recruitment.reduce((a, b) => a + (b.costLow || 0), 0);
+  const investmentHigh = recruitment.reduce((a, b) => a + (b.costHigh || 0), 0);
+
+  const getFitColor = (score) => {
+    if (score >= 75) return '#22C55E';
+    if (score >= 60) return '#84CC16';
+    if (score >= 45) return '#EAB308';
+    if (score >= 30) return '#F97316';
+    return '#EF4444';
+  };
+
+  const getClassificationColor = (cls) => ({
+    'Key Enabler': '#22C55E', 'Good Fit': '#84CC16',
+    'System Dependent': '#EAB308', 'Potentially Marginalised': '#EF4444'
+  })[cls] || '#64748B';
+
+  const KPICard = ({ title, value, subtitle, color, icon }) => (
+    <div className="bg-slate-800/60 backdrop-blur border border-slate-700/50 rounded-xl p-4">
+      <div className="flex items-start justify-between">
+        <div>
+          <div className="text-slate-400 text-xs uppercase tracking-wider font-medium">{title}</div>
+          <div className={`text-2xl font-bold mt-1 ${color || 'text-white'}`}>{value}</div>
+          {subtitle && <div className="text-slate-500 text-sm mt-1">{subtitle}</div>}
+        </div>
+        {icon && <div className="text-2xl opacity-50">{icon}</div>}
+      </div>
+    </div>
+  );
+
+  const ClusterScatter = () => {
+    if (allManagers.length === 0) return <div className="text-slate-500 text-center py-8">No manager data</div>;
+    const minX = Math.min(...allManagers.map(m => m.pca1)) - 0.5;
+    const maxX = Math.max(...allManagers.map(m => m.pca1)) + 0.5;
+    const minY = Math.min(...allManagers.map(m => m.pca2)) - 0.5;
+    const maxY = Math.max(...allManagers.map(m => m.pca2)) + 0.5;
+    const scaleX = (val) => ((val - minX) / (maxX - minX)) * 100;
+    const scaleY = (val) => 100 - ((val - minY) / (maxY - minY)) * 100;
+    const clusterColors = {};
+    clusters.forEach(c => { clusterColors[c.id] = c.color; });
+    return (
+      <div className="flex flex-col h-full">
+        <div className="relative flex-1 bg-slate-900/50 rounded-xl min-h-[220px]">
+          {allManagers.map((m, i) => (
+            <div key={i}
+              className={`absolute w-3.5 h-3.5 rounded-full transform -translate-x-1/2 -translate-y-1/2 cursor-pointer transition-all hover:scale-150 hover:z-20 ${m.name === managerData.name ? 'ring-2 ring-white ring-offset-1 ring-offset-slate-900 z-10 w-5 h-5' : ''}`}
+              style={{ left: `${2 + scaleX(m.pca1) * 0.96}%`, top: `${2 + scaleY(m.pca2) * 0.96}%`, backgroundColor: clusterColors[m.cluster] || '#64748B' }}
+              title={`${m.name} (${m.team})`}>
+              {m.name === managerData.name && (
+                <div className="absolute -top-5 left-1/2 -translate-x-1/2 text-xs font-bold text-white whitespace-nowrap bg-slate-800/90 px-1.5 py-0.5 rounded">{managerData.name}</div>
+              )}
+            </div>
+          ))}
+        </div>
+        <div className="flex flex-wrap justify-center gap-x-4 gap-y-1 mt-3 pt-3 border-t border-slate-700/50">
+          {clusters.map((c) => (
+            <div key={c.id} className="flex items-center gap-1.5">
+              <div className="w-2.5 h-2.5 rounded-full flex-shrink-0" style={{ backgroundColor: c.color }} />
+              <span className="text-slate-400 text-xs">{c.name}</span>
+            </div>
+          ))}
+        </div>
+      </div>
+    );
+  };
+
+  const FormationPitch = () => (
+    <div className="relative w-full aspect-[3/4] bg-gradient-to-b from-emerald-900/90 to-emerald-800/90 rounded-xl overflow-hidden border border-emerald-700/30">
+      <div className="absolute inset-3 border-2 border-white/20 rounded">
+        <div className="absolute top-1/2 left-0 right-0 h-0.5 bg-white/20" />
+        <div className="absolute top-1/2 left-1/2 -translate-x-1/2 -translate-y-1/2 w-14 h-14 border-2 border-white/20 rounded-full" />
+        <div className="absolute top-0 left-1/2 -translate-x-1/2 w-28 h-10 border-2 border-t-0 border-white/20" />
+        <div className="absolute bottom-0 left-1/2 -translate-x-1/2 w-28 h-10 border-2 border-b-0 border-white/20" />
+      </div>
+      {idealXI.map((player, i) => (
+        <div key={i} className="absolute transform -translate-x-1/2 -translate-y-1/2 text-center group" style={{ left: `${player.x}%`, top: `${player.y}%` }}>
+          <div className="w-9 h-9 rounded-full flex items-center justify-center text-white font-bold text-xs border-2 shadow-lg transition-transform group-hover:scale-110"
+            style={{ backgroundColor: getFitColor(player.fit), borderColor: 'rgba(255,255,255,0.3)' }}>
+            {Math.round(player.fit)}
+          </div>
+          <div className="text-white text-xs mt-1 font-medium drop-shadow-lg opacity-90">{player.name.split(' ').pop()}</div>
+          <div className="text-white/60 text-xs">{player.slot}</div>
+        </div>
+      ))}
+    </div>
+  );
+
+  const PositionFitBars = () => (
+    <div className="space-y-2">
+      {positionGaps.map((pos, i) => (
+        <div key={i} className="flex items-center gap-3">
+          <div className="w-28 text-sm text-slate-300 truncate">{pos.position}</div>
+          <div className="flex-1 h-5 bg-slate-700/50 rounded-full overflow-hidden relative">
+            <div className="h-full rounded-full" style={{ width: `${Math.min(pos.avgFit, 100)}%`, backgroundColor: getFitColor(pos.avgFit) }} />
+            {pos.maxFit > 0 && <div className="absolute top-0 h-full w-0.5 bg-white/60" style={{ left: `${Math.min(pos.maxFit, 100)}%` }} />}
+            <div className="absolute top-0 h-full w-px bg-white/30 left-3/4" />
+          </div>
+          <div className="w-10 text-right font-mono text-sm text-slate-300">{pos.avgFit.toFixed(1)}</div>
+          <div className="w-6 text-center text-slate-500 text-xs">({pos.count})</div>
+        </div>
+      ))}
+    </div>
+  );
+
+  const SquadTable = () => (
+    <div className="overflow-auto max-h-80">
+      <table className="w-full text-sm">
+        <thead className="sticky top-0 bg-slate-800">
+          <tr className="text-slate-400 text-xs uppercase tracking-wider">
+            <th className="px-3 py-2 text-left">Player</th>
+            <th className="px-3 py-2 text-left">Position</th>
+            <th className="px-3 py-2 text-center">Fit</th>
+            <th className="px-3 py-2 text-left">Classification</th>
+          </tr>
+        </thead>
+        <tbody>
+          {[...squadFit].sort((a, b) => b.fit - a.fit).map((player, i) => (
+            <tr key={i} className="border-t border-slate-700/30 hover:bg-slate-700/20">
+              <td className="px-3 py-2 font-medium">{player.name}</td>
+              <td className="px-3 py-2 text-slate-400">{player.position}</td>
+              <td className="px-3 py-2 text-center">
+                <span className="inline-block w-10 py-0.5 rounded text-xs font-bold" style={{ backgroundColor: getFitColor(player.fit) + '30', color: getFitColor(player.fit) }}>{player.fit.toFixed(0)}</span>
+              </td>
+              <td className="px-3 py-2">
+                <span className="text-xs px-2 py-0.5 rounded" style={{ backgroundColor: getClassificationColor(player.classification) + '20', color: getClassificationColor(player.classification) }}>{player.classification}</span>
+              </td>
+            </tr>
+          ))}
+        </tbody>
+      </table>
+    </div>
+  );
+
+  const RecruitmentTable = () => (
+    <div>
+      <table className="w-full text-sm">
+        <thead className="bg-slate-700/30">
+          <tr className="text-slate-400 text-xs uppercase tracking-wider">
+            <th className="px-4 py-3 text-left">#</th>
+            <th className="px-4 py-3 text-left">Position</th>
+            <th className="px-4 py-3 text-center">Urgency</th>
+            <th className="px-4 py-3 text-center">Gap</th>
+            <th className="px-4 py-3 text-center">Window</th>
+            <th className="px-4 py-3 text-right">Est. Cost</th>
+          </tr>
+        </thead>
+        <tbody>
+          {recruitment.map((r, i) => (
+            <tr key={i} className="border-t border-slate-700/30 hover:bg-slate-700/20">
+              <td className="px-4 py-3 font-bold text-slate-500">{r.rank}</td>
+              <td className="px-4 py-3 font-medium">{r.position}</td>
+              <td className="px-4 py-3 text-center">
+                <span className={`px-2 py-1 rounded text-xs font-medium ${r.urgency === 'Critical' ? 'bg-red-500/20 text-red-400' : r.urgency === 'High' ? 'bg-orange-500/20 text-orange-400' : 'bg-amber-500/20 text-amber-400'}`}>{r.urgency}</span>
+              </td>
+              <td className="px-4 py-3 text-center font-mono">{r.gap.toFixed(1)}</td>
+              <td className="px-4 py-3 text-center text-slate-400">{r.timeline}</td>
+              <td className="px-4 py-3 text-right font-mono">£{r.costLow}-{r.costHigh}M</td>
+            </tr>
+          ))}
+        </tbody>
+        {recruitment.length > 0 && (
+          <tfoot className="bg-slate-700/20 border-t border-slate-600/50">
+            <tr>
+              <td colSpan={5} className="px-4 py-3 text-right font-medium text-slate-300">Total Investment</td>
+              <td className="px-4 py-3 text-right font-bold text-lg text-white">£{investmentLow}-{investmentHigh}M</td>
+            </tr>
+          </tfoot>
+        )}
+      </table>
+    </div>
+  );
+
+  const ManagerDNARadar = () => {
+    const dims = Object.entries(dnaPillars);
+    const n = dims.length;
+    const angleStep = (2 * Math.PI) / n;
+    const centerX = 120, centerY = 120, maxRadius = 90;
+    const points = dims.map(([label, value], i) => {
+      const angle = i * angleStep - Math.PI / 2;
+      const radius = (Math.min(value, 100) / 100) * maxRadius;
+      return { x: centerX + Math.cos(angle) * radius, y: centerY + Math.sin(angle) * radius, label, value };
+    });
+    const polygonPoints = points.map(p => `${p.x},${p.y}`).join(' ');
+    return (
+      <div className="flex flex-col items-center">
+        <svg width="280" height="280" className="overflow-visible">
+          {[25, 50, 75, 100].map((level) => (<circle key={level} cx={centerX} cy={centerY} r={(level / 100) * maxRadius} fill="none" stroke="#334155" strokeWidth="1" opacity="0.5" />))}
+          {dims.map((_, i) => { const angle = i * angleStep - Math.PI / 2; return (<line key={i} x1={centerX} y1={centerY} x2={centerX + Math.cos(angle) * maxRadius} y2={centerY + Math.sin(angle) * maxRadius} stroke="#334155" strokeWidth="1" opacity="0.5" />); })}
+          <polygon points={polygonPoints} fill="#F59E0B" fillOpacity="0.3" stroke="#F59E0B" strokeWidth="2" />
+          {points.map((p, i) => (<circle key={i} cx={p.x} cy={p.y} r="4" fill="#F59E0B" stroke="#FCD34D" strokeWidth="2" />))}
+          {dims.map(([label], i) => { const angle = i * angleStep - Math.PI / 2; const labelRadius = maxRadius + 22; const x = centerX + Math.cos(angle) * labelRadius; const y = centerY + Math.sin(angle) * labelRadius; return (<text key={i} x={x} y={y} textAnchor="middle" dominantBaseline="middle" className="fill-slate-400" style={{fontSize: '9px'}}>{label}</text>); })}
+          {points.map((p, i) => (<text key={'v'+i} x={p.x} y={p.y - 10} textAnchor="middle" className="fill-amber-300" style={{fontSize: '10px', fontWeight: 'bold'}}>{Math.round(p.value)}</text>))}
+        </svg>
+        <div className="mt-4 px-4 py-2 rounded-full bg-amber-500/20 border border-amber-500/50">
+          <span className="text-amber-400 font-semibold">Cluster: {managerData.clusterName}</span>
+        </div>
+      </div>
+    );
+  };
+
+  return (
+    <div className="min-h-screen bg-gradient-to-br from-slate-950 via-slate-900 to-slate-950 text-white">
+      <div className="border-b border-slate-800 bg-slate-900/50 backdrop-blur sticky top-0 z-30">
+        <div className="max-w-7xl mx-auto px-6 py-4">
+          <div className="flex items-center justify-between">
+            <div className="flex items-center gap-4">
+              <div className="w-10 h-10 rounded-xl bg-gradient-to-br from-amber-500 to-orange-600 flex items-center justify-center font-black text-lg">A</div>
+              <div>
+                <h1 className="text-xl font-bold tracking-tight">Manager Tactical Fit Intelligence</h1>
+                <p className="text-slate-400 text-sm">Aegis Football Advisory Group</p>
+              </div>
+            </div>
+            <div className="text-right">
+              <div className="text-lg font-semibold">{managerData.name} → {managerData.team}</div>
+              <div className="text-slate-400 text-sm">{season} Season Analysis</div>
+            </div>
+          </div>
+        </div>
+      </div>
+
+      <div className="max-w-7xl mx-auto px-6 py-6">
+        <div className="grid grid-cols-2 md:grid-cols-6 gap-4 mb-6">
+          <KPICard title="Squad Avg Fit" value={`${avgFit}%`} subtitle={`${totalPlayers} players`} icon="📊" />
+          <KPICard title="Key Enablers" value={keyEnablers} subtitle="≥75" color="text-emerald-400" icon="🟢" />
+          <KPICard title="Good Fit" value={goodFit} subtitle="60-74" color="text-lime-400" icon="🟡" />
+          <KPICard title="System Dependent" value={systemDependent} subtitle="45-59" color="text-amber-400" icon="🟠" />
+          <KPICard title="Marginalised" value={marginalised} subtitle="<45" color="text-red-400" icon="🔴" />
+          <KPICard title="Investment Req." value={`£${investmentLow}-${investmentHigh}M`} subtitle={`${recruitment.length} priorities`} icon="💰" />
+        </div>
+
+        <div className="grid grid-cols-1 lg:grid-cols-3 gap-6 mb-6">
+          <div className="bg-slate-800/40 backdrop-blur border border-slate-700/50 rounded-2xl p-5">
+            <h2 className="text-lg font-semibold mb-2 flex items-center gap-2"><span className="w-2 h-2 rounded-full bg-amber-500"></span>Manager DNA</h2>
+            <div className="text-center mb-2">
+              <div className="text-xl font-bold">{managerData.name}</div>
+              <div className="text-slate-400 text-sm">{managerData.team}</div>
+            </div>
+            <ManagerDNARadar />
+            <div className="grid grid-cols-2 gap-2 mt-4 text-sm">
+              <div className="bg-slate-700/30 rounded-lg p-2 text-center">
+                <div className="text-slate-400 text-xs">Goals/Game</div>
+                <div className="font-bold text-lg">{managerData.goalsScored?.toFixed(2) || 'N/A'}</div>
+              </div>
+              <div className="bg-slate-700/30 rounded-lg p-2 text-center">
+                <div className="text-slate-400 text-xs">Conceded/Game</div>
+                <div className="font-bold text-lg">{managerData.goalsConceded?.toFixed(2) || 'N/A'}</div>
+              </div>
+            </div>
+          </div>
+
+          <div className="bg-slate-800/40 backdrop-blur border border-slate-700/50 rounded-2xl p-5 flex flex-col">
+            <h2 className="text-lg font-semibold mb-4 flex items-center gap-2"><span className="w-2 h-2 rounded-full bg-violet-500"></span>Manager Clustering (PCA)</h2>
+            <ClusterScatter />
+            <div className="mt-3 text-sm">
+              <span className="text-amber-400 font-semibold">{managerData.name}</span>
+              <span className="text-slate-400"> clusters with </span>
+              <span className="text-white font-semibold">{managerData.clusterName}</span>
+              <span className="text-slate-400"> managers</span>
+            </div>
+          </div>
+
+          <div className="bg-slate-800/40 backdrop-blur border border-slate-700/50 rounded-2xl p-5">
+            <h2 className="text-lg font-semibold mb-4 flex items-center gap-2"><span className="w-2 h-2 rounded-full bg-emerald-500"></span>Ideal XI (4-3-3)</h2>
+            <FormationPitch />
+            <div className="mt-3 flex justify-center gap-3 text-xs flex-wrap">
+              <div className="flex items-center gap-1"><div className="w-3 h-3 rounded-full bg-emerald-500"></div><span className="text-slate-400">≥75</span></div>
+              <div className="flex items-center gap-1"><div className="w-3 h-3 rounded-full bg-lime-500"></div><span className="text-slate-400">60-74</span></div>
+              <div className="flex items-center gap-1"><div className="w-3 h-3 rounded-full bg-yellow-500"></div><span className="text-slate-400">45-59</span></div>
+              <div className="flex items-center gap-1"><div className="w-3 h-3 rounded-full bg-red-500"></div><span className="text-slate-400">&lt;45</span></div>
+            </div>
+          </div>
+        </div>
+
+        <div className="grid grid-cols-1 lg:grid-cols-2 gap-6">
+          <div className="bg-slate-800/40 backdrop-blur border border-slate-700/50 rounded-2xl p-5">
+            <h2 className="text-lg font-semibold mb-4 flex items-center gap-2"><span className="w-2 h-2 rounded-full bg-blue-500"></span>Positional Fit Analysis</h2>
+            {positionGaps.length > 0 ? <PositionFitBars /> : <div className="text-slate-500 text-center py-4">No positional data</div>}
+          </div>
+
+          <div className="bg-slate-800/40 backdrop-blur border border-slate-700/50 rounded-2xl p-5">
+            <h2 className="text-lg font-semibold mb-4 flex items-center gap-2"><span className="w-2 h-2 rounded-full bg-red-500"></span>Recruitment Priorities</h2>
+            {recruitment.length > 0 ? <RecruitmentTable /> : <div className="text-slate-500 text-center py-4">No recruitment priorities</div>}
+          </div>
+        </div>
+
+        <div className="mt-6 bg-slate-800/40 backdrop-blur border border-slate-700/50 rounded-2xl p-5">
+          <h2 className="text-lg font-semibold mb-4 flex items-center gap-2"><span className="w-2 h-2 rounded-full bg-cyan-500"></span>Full Squad Fit Scores</h2>
+          {squadFit.length > 0 ? <SquadTable /> : <div className="text-slate-500 text-center py-4">No squad data</div>}
+        </div>
 
-        ReactDOM.render(<Dashboard />, document.getElementById('root'));
+        <div className="mt-8 pt-6 border-t border-slate-800 flex items-center justify-between text-sm text-slate-500">
+          <div>MTFI Prototype v0.2 • Data Source: StatsBomb</div>
+          <div>Generated: ''',
+'''</div>
+        </div>
+      </div>
+    </div>
+  );
+};
+
+ReactDOM.render(<MTFIDashboard />, document.getElementById('root'));
     </script>
 </body>
-</html>'''
-        
-        return html
+</html>''',
+)
 
-    # =========================================================================
-    # DNA RADAR
-    # =========================================================================
-    
-    def plot_dna_radar(self):
-        """Generate Manager DNA radar chart."""
-        import numpy as np
-        
-        dimensions = self.results.get("dna_dimensions", {})
-        labels = list(dimensions.keys())
-        values = list(dimensions.values())
-        
-        # Complete the loop
-        values += values[:1]
-        angles = np.linspace(0, 2 * np.pi, len(labels), endpoint=False).tolist()
-        angles += angles[:1]
-        
-        fig, ax = self.plt.subplots(figsize=(10, 10), subplot_kw=dict(polar=True))
-        
-        # Plot
-        ax.fill(angles, values, color=self.COLORS["primary"], alpha=0.25)
-        ax.plot(angles, values, color=self.COLORS["primary"], linewidth=2)
-        ax.scatter(angles[:-1], values[:-1], color=self.COLORS["primary"], s=80, zorder=5)
-        
-        # Labels
-        ax.set_xticks(angles[:-1])
-        ax.set_xticklabels(labels, size=11)
-        ax.set_ylim(0, 100)
-        
-        # Title
-        manager = self.results.get("manager", "Unknown")
-        ax.set_title(f"Manager DNA: {manager}", size=16, fontweight="bold", pad=20)
-        
-        self.plt.tight_layout()
-        self.plt.savefig(self.output_dir / "01_manager_dna_radar.png", dpi=150, bbox_inches="tight")
-        self.plt.close()
-        print("  ✓ 01_manager_dna_radar.png")
-    
-    # =========================================================================
-    # FORMATION USAGE
-    # =========================================================================
-    
-    def plot_formation_usage(self, formation_data: dict = None):
-        """Generate formation usage bar chart.
-        
-        Args:
-            formation_data: Dict from compute_formation_tendency() with 'raw_counts' key.
-                            If None, falls back to illustrative placeholder data.
-        """
-        fig, ax = self.plt.subplots(figsize=(10, 6))
-        
-        if formation_data and formation_data.get("raw_counts"):
-            from .formations import normalize_formation
-            raw = formation_data["raw_counts"]
-            top = sorted(raw.items(), key=lambda x: x[1], reverse=True)[:5]
-            total = sum(v for _, v in top)
-            formations = [normalize_formation(k) for k, _ in top]
-            usage = [round(v / max(total, 1) * 100, 1) for _, v in top]
-        else:
-            # Illustrative placeholder — replaced once formation_data flows through
-            formations = ["4-3-3", "3-5-2", "4-2-3-1", "3-4-3", "5-3-2"]
-            usage = [39.5, 26.3, 17.1, 10.5, 6.6]
-        
-        bars = ax.barh(formations, usage, color=self.COLORS["primary"])
-        
-        # Add percentage labels
-        for bar, pct in zip(bars, usage):
-            ax.text(bar.get_width() + 1, bar.get_y() + bar.get_height()/2,
-                   f"{pct}%", va="center", fontweight="bold")
-        
-        ax.set_xlabel("Usage %")
-        ax.set_title("Formation Usage", fontweight="bold", size=14)
-        ax.set_xlim(0, 50)
-        
-        self.plt.tight_layout()
-        self.plt.savefig(self.output_dir / "02_formation_usage.png", dpi=150, bbox_inches="tight")
-        self.plt.close()
-        print("  ✓ 02_formation_usage.png")
-    
-    # =========================================================================
-    # SQUAD FIT
-    # =========================================================================
-    
-    def plot_squad_fit(self):
-        """Generate squad fit score distribution."""
-        # Load squad fit CSV
-        squad_file = self.output_dir / "squad_fit_scores.csv"
-        players = []
-        if squad_file.exists():
-            with open(squad_file) as f:
-                reader = csv.DictReader(f)
-                players = list(reader)
-        
-        if not players:
-            print("  ⚠ No squad fit data")
-            return
-        
-        # Sort by score
-        players.sort(key=lambda x: float(x.get("Fit Score", 0)), reverse=True)
-        
-        fig, ax = self.plt.subplots(figsize=(12, max(8, len(players) * 0.4)))
-        
-        names = [p["Name"] for p in players]
-        scores = [float(p["Fit Score"]) for p in players]
-        classifications = [p["Classification"] for p in players]
-        colors = [self.COLORS.get(c, self.COLORS["secondary"]) for c in classifications]
-        
-        bars = ax.barh(names, scores, color=colors)
-        
-        # Add score labels
-        for bar, score in zip(bars, scores):
-            ax.text(bar.get_width() + 1, bar.get_y() + bar.get_height()/2,
-                   f"{score:.0f}", va="center", fontsize=9)
-        
-        ax.set_xlabel("Fit Score")
-        ax.set_xlim(0, 110)
-        ax.set_title("Squad Fit Scores", fontweight="bold", size=14)
-        ax.invert_yaxis()
-        
-        # Legend
-        handles = [self.mpatches.Patch(color=self.COLORS[c], label=c) 
-                  for c in ["Key Enabler", "Good Fit", "System Dependent", "Potentially Marginalised"]]
-        ax.legend(handles=handles, loc="lower right")
-        
-        self.plt.tight_layout()
-        self.plt.savefig(self.output_dir / "03_squad_fit_scores.png", dpi=150, bbox_inches="tight")
-        self.plt.close()
-        print("  ✓ 03_squad_fit_scores.png")
-    
-    # =========================================================================
-    # CLASSIFICATION PIE
-    # =========================================================================
-    
-    def plot_classification_pie(self):
-        """Generate classification distribution pie chart."""
-        summary = self.results.get("squad_summary", {})
-        
-        labels = ["Key Enabler", "Good Fit", "System Dependent", "Potentially Marginalised"]
-        sizes = [
-            summary.get("key_enablers", 0),
-            summary.get("good_fit", 0),
-            summary.get("system_dependent", 0),
-            summary.get("marginalised", 0)
-        ]
-        colors = [self.COLORS[l] for l in labels]
-        
-        # Filter out zeros
-        data = [(l, s, c) for l, s, c in zip(labels, sizes, colors) if s > 0]
-        if not data:
-            return
-        
-        labels, sizes, colors = zip(*data)
-        
-        fig, ax = self.plt.subplots(figsize=(10, 8))
-        
-        wedges, texts, autotexts = ax.pie(
-            sizes, labels=labels, colors=colors, autopct="%1.0f%%",
-            startangle=90, textprops={"fontsize": 11}
-        )
-        
-        ax.set_title("Squad Classification", fontweight="bold", size=14)
-        
-        self.plt.tight_layout()
-        self.plt.savefig(self.output_dir / "04_classification_pie.png", dpi=150, bbox_inches="tight")
-        self.plt.close()
-        print("  ✓ 04_classification_pie.png")
-    
-    # =========================================================================
-    # IDEAL XI PITCH
-    # =========================================================================
-    
-    def plot_ideal_xi(self):
-        """Generate ideal XI pitch visualization."""
-        ideal_xi = self.results.get("ideal_xi", [])
-        
-        # 4-3-3 positions (x, y coordinates on pitch)
-        positions = {
-            "GK": (50, 92),
-            "LB": (15, 70),
-            "CB1": (35, 75),
-            "CB2": (65, 75),
-            "RB": (85, 70),
-            "DM": (50, 55),
-            "CM": (30, 45),
-            "AM": (70, 45),
-            "LW": (15, 25),
-            "CF": (50, 15),
-            "RW": (85, 25)
-        }
-        
-        fig, ax = self.plt.subplots(figsize=(10, 14))
-        
-        # Draw pitch
-        ax.set_facecolor("#2d5a27")
-        ax.set_xlim(0, 100)
-        ax.set_ylim(0, 100)
-        
-        # Pitch markings
-        ax.axhline(y=50, color="white", linewidth=2, alpha=0.7)
-        
-        # Centre circle
-        circle = self.plt.Circle((50, 50), 10, fill=False, color="white", linewidth=2, alpha=0.7)
-        ax.add_patch(circle)
-        
-        # Penalty areas
-        ax.add_patch(self.plt.Rectangle((25, 82), 50, 18, fill=False, color="white", linewidth=2, alpha=0.7))
-        ax.add_patch(self.plt.Rectangle((25, 0), 50, 18, fill=False, color="white", linewidth=2, alpha=0.7))
-        
-        # Plot players
-        for player in ideal_xi:
-            pos_key = player.get("position", "")
-            if pos_key in positions:
-                x, y = positions[pos_key]
-                score = player.get("fit_score", 0)
-                
-                # Colour based on score
-                if score >= 75:
-                    color = self.COLORS["Key Enabler"]
-                elif score >= 60:
-                    color = self.COLORS["Good Fit"]
-                else:
-                    color = self.COLORS["System Dependent"]
-                
-                # Player circle
-                circle = self.plt.Circle((x, y), 5, color=color, ec="white", linewidth=2, zorder=5)
-                ax.add_patch(circle)
-                
-                # Score in circle
-                ax.text(x, y, f"{score:.0f}", ha="center", va="center",
-                       color="white", fontweight="bold", fontsize=10, zorder=6)
-                
-                # Name below
-                name = player.get("name", "").split()[-1]  # Last name only
-                ax.text(x, y - 8, name, ha="center", va="center",
-                       color="white", fontsize=9, fontweight="bold",
-                       bbox=dict(boxstyle="round", facecolor="black", alpha=0.5))
-        
-        ax.set_aspect("equal")
-        ax.axis("off")
-        ax.set_title("Ideal XI (4-3-3)", fontweight="bold", size=16, color="white", pad=20)
-        
-        fig.patch.set_facecolor("#2d5a27")
-        self.plt.tight_layout()
-        self.plt.savefig(self.output_dir / "05_ideal_xi_pitch.png", dpi=150, 
-                        bbox_inches="tight", facecolor="#2d5a27")
-        self.plt.close()
-        print("  ✓ 05_ideal_xi_pitch.png")
-    
-    # =========================================================================
-    # RECRUITMENT
-    # =========================================================================
-    
-    def plot_recruitment(self):
-        """Generate recruitment priorities chart."""
-        recruitment = self.results.get("recruitment", [])
-        
-        if not recruitment:
-            print("  ⚠ No recruitment priorities")
-            return
-        
-        fig, ax = self.plt.subplots(figsize=(12, max(6, len(recruitment) * 0.8)))
-        
-        positions = [r["position"] for r in recruitment]
-        gaps = [r["gap"] for r in recruitment]
-        urgencies = [r["urgency"] for r in recruitment]
-        
-        colors = {
-            "Critical": "#ef4444",
-            "High": "#f97316",
-            "Medium": "#eab308"
-        }
-        bar_colors = [colors.get(u, "#64748b") for u in urgencies]
-        
-        bars = ax.barh(positions, gaps, color=bar_colors)
-        
-        # Add cost labels
-        for bar, r in zip(bars, recruitment):
-            ax.text(bar.get_width() + 0.5, bar.get_y() + bar.get_height()/2,
-                   f"£{r['cost_low']}M-£{r['cost_high']}M",
-                   va="center", fontsize=10)
-        
-        ax.set_xlabel("Fit Gap (points below 75)")
-        ax.set_title("Recruitment Priorities", fontweight="bold", size=14)
-        ax.set_xlim(0, max(gaps) * 1.5 if gaps else 30)
-        ax.invert_yaxis()
-        
-        # Legend
-        handles = [self.mpatches.Patch(color=colors[u], label=u) for u in ["Critical", "High", "Medium"]]
-        ax.legend(handles=handles, loc="lower right")
-        
-        self.plt.tight_layout()
-        self.plt.savefig(self.output_dir / "06_recruitment_priorities.png", dpi=150, bbox_inches="tight")
-        self.plt.close()
-        print("  ✓ 06_recruitment_priorities.png")
-    
-    # =========================================================================
-    # EXECUTIVE SUMMARY
-    # =========================================================================
-    
-    def plot_executive_summary(self):
-        """Generate executive summary dashboard."""
-        import numpy as np
-        
-        fig = self.plt.figure(figsize=(16, 12))
-        
-        manager = self.results.get("manager", "Unknown")
-        fig.suptitle(f"Aegis Analysis: {manager}", fontsize=20, fontweight="bold", y=0.98)
-        
-        # Grid layout
-        gs = fig.add_gridspec(2, 3, hspace=0.3, wspace=0.3)
-        
-        # 1. DNA Dimensions (bar chart)
-        ax1 = fig.add_subplot(gs[0, 0])
-        dims = self.results.get("dna_dimensions", {})
-        ax1.barh(list(dims.keys()), list(dims.values()), color=self.COLORS["primary"])
-        ax1.set_xlim(0, 100)
-        ax1.set_title("Manager DNA", fontweight="bold")
-        
-        # 2. Classification (pie)
-        ax2 = fig.add_subplot(gs[0, 1])
-        summary = self.results.get("squad_summary", {})
-        sizes = [summary.get("key_enablers", 0), summary.get("good_fit", 0),
-                summary.get("system_dependent", 0), summary.get("marginalised", 0)]
-        labels = ["Key Enabler", "Good Fit", "System Dep.", "Marginalised"]
-        colors = [self.COLORS[l.replace(" Dep.", " Dependent").replace("Marginalised", "Potentially Marginalised")] 
-                 for l in labels]
-        
-        # Filter zeros
-        data = [(l, s, c) for l, s, c in zip(labels, sizes, colors) if s > 0]
-        if data:
-            labels, sizes, colors = zip(*data)
-            ax2.pie(sizes, labels=labels, colors=colors, autopct="%1.0f%%")
-        ax2.set_title("Squad Classification", fontweight="bold")
-        
-        # 3. Key Metrics
-        ax3 = fig.add_subplot(gs[0, 2])
-        ax3.axis("off")
-        metrics_text = f"""
-        Matches Analysed: {self.results.get('matches_analysed', 0)}
-        
-        Squad Size: {summary.get('total', 0)}
-        
-        Average Fit: {summary.get('average_fit', 0):.1f}
-        
-        Key Enablers: {summary.get('key_enablers', 0)}
-        """
-        ax3.text(0.1, 0.5, metrics_text, fontsize=14, verticalalignment="center",
-                fontfamily="monospace")
-        ax3.set_title("Key Metrics", fontweight="bold")
-        
-        # 4. Top 5 Fits
-        ax4 = fig.add_subplot(gs[1, 0])
-        ideal = self.results.get("ideal_xi", [])[:5]
-        if ideal:
-            names = [p["name"].split()[-1] for p in ideal]
-            scores = [p["fit_score"] for p in ideal]
-            ax4.barh(names, scores, color=self.COLORS["Key Enabler"])
-            ax4.set_xlim(0, 100)
-        ax4.set_title("Top 5 Fit Scores", fontweight="bold")
-        ax4.invert_yaxis()
-        
-        # 5. Recruitment
-        ax5 = fig.add_subplot(gs[1, 1])
-        recruitment = self.results.get("recruitment", [])[:4]
-        if recruitment:
-            positions = [r["position"] for r in recruitment]
-            gaps = [r["gap"] for r in recruitment]
-            ax5.barh(positions, gaps, color="#f97316")
-        ax5.set_title("Top Recruitment Needs", fontweight="bold")
-        ax5.invert_yaxis()
-        
-        # 6. Investment Summary
-        ax6 = fig.add_subplot(gs[1, 2])
-        ax6.axis("off")
-        recruitment_full = self.results.get("recruitment", [])
-        total_low = sum(r.get("cost_low", 0) for r in recruitment_full)
-        total_high = sum(r.get("cost_high", 0) for r in recruitment_full)
-        
-        investment_text = f"""
-        Total Investment Required:
-        
-        £{total_low}M - £{total_high}M
-        
-        Priority Signings: {len(recruitment_full)}
-        """
-        ax6.text(0.1, 0.5, investment_text, fontsize=14, verticalalignment="center",
-                fontfamily="monospace")
-        ax6.set_title("Investment Summary", fontweight="bold")
-        
-        self.plt.savefig(self.output_dir / "07_executive_summary.png", dpi=150, bbox_inches="tight")
-        self.plt.close()
-        print("  ✓ 07_executive_summary.png")
 
 
-# =============================================================================
-# STANDALONE CONVENIENCE FUNCTION
-# =============================================================================
-
 def generate_mtfi_dashboard(
     data_dir: str = ".",
     output_path: str = "MTFI_Dashboard.html",